@@ -7,9 +7,11 @@ Files are automatically cleaned up after expiration (default 1 hour).
 
 import base64
 import logging
+import shutil
 import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import IO
 
 logger = logging.getLogger(__name__)
 
@@ -55,11 +57,56 @@ class AttachmentStorage:
             logger.error(f"Failed to decode base64 attachment data: {e}")
             raise ValueError(f"Invalid base64 data: {e}") from e
 
-        # Determine file extension from filename or mime type
-        extension = ""
+        file_path = STORAGE_DIR / f"{file_id}{self._extension_for(filename, mime_type)}"
+        try:
+            file_path.write_bytes(file_bytes)
+            logger.info(f"Saved attachment {file_id} ({len(file_bytes)} bytes) to {file_path}")
+        except Exception as e:
+            logger.error(f"Failed to save attachment to {file_path}: {e}")
+            raise
+
+        self._record_metadata(file_id, file_path, filename, mime_type, len(file_bytes))
+        return file_id
+
+    def save_attachment_file(
+        self,
+        file_obj: IO[bytes],
+        filename: str | None = None,
+        mime_type: str | None = None,
+    ) -> str:
+        """
+        Save raw attachment bytes from a binary file object and return a unique file ID.
+
+        The file object is read from its current position in chunks, so large
+        downloads are never held in memory or base64-encoded.
+
+        Args:
+            file_obj: Readable binary file object
+            filename: Original filename (optional)
+            mime_type: MIME type (optional)
+
+        Returns:
+            Unique file ID (UUID string)
+        """
+        file_id = str(uuid.uuid4())
+        file_path = STORAGE_DIR / f"{file_id}{self._extension_for(filename, mime_type)}"
+        try:
+            with file_path.open("wb") as out:
+                shutil.copyfileobj(file_obj, out)
+                size = out.tell()
+            logger.info(f"Saved attachment {file_id} ({size} bytes) to {file_path}")
+        except Exception as e:
+            logger.error(f"Failed to save attachment to {file_path}: {e}")
+            raise
+
+        self._record_metadata(file_id, file_path, filename, mime_type, size)
+        return file_id
+
+    def _extension_for(self, filename: str | None, mime_type: str | None) -> str:
+        """Determine file extension from filename or mime type."""
         if filename:
-            extension = Path(filename).suffix
-        elif mime_type:
+            return Path(filename).suffix
+        if mime_type:
             # Basic mime type to extension mapping
             mime_to_ext = {
                 "image/jpeg": ".jpg",
@@ -70,30 +117,28 @@ class AttachmentStorage:
                 "text/plain": ".txt",
                 "text/html": ".html",
             }
-            extension = mime_to_ext.get(mime_type, "")
+            return mime_to_ext.get(mime_type, "")
+        return ""
 
-        # Save file
-        file_path = STORAGE_DIR / f"{file_id}{extension}"
-        try:
-            file_path.write_bytes(file_bytes)
-            logger.info(f"Saved attachment {file_id} ({len(file_bytes)} bytes) to {file_path}")
-        except Exception as e:
-            logger.error(f"Failed to save attachment to {file_path}: {e}")
-            raise
-
-        # Store metadata
+    def _record_metadata(
+        self,
+        file_id: str,
+        file_path: Path,
+        filename: str | None,
+        mime_type: str | None,
+        size: int,
+    ) -> None:
+        """Store metadata for a saved attachment."""
         expires_at = datetime.now() + timedelta(seconds=self.expiration_seconds)
         self._metadata[file_id] = {
             "file_path": str(file_path),
-            "filename": filename or f"attachment{extension}",
+            "filename": filename or f"attachment{file_path.suffix}",
             "mime_type": mime_type or "application/octet-stream",
-            "size": len(file_bytes),
+            "size": size,
             "created_at": datetime.now(),
             "expires_at": expires_at,
         }
 
-        return file_id
-
     def get_attachment_path(self, file_id: str) -> Path | None:
         """
         Get the file path for an attachment ID.
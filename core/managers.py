@@ -113,10 +113,10 @@ class SearchManager:
 
     def resolve_alias(self, query: str) -> str:
         """Resolve a single-letter alias to a file_id."""
+        if len(query) != 1:
+            return query  # Full file IDs never need the lock or a lookup
         with self._lock:
-            if len(query) == 1 and query.upper() in self.search_cache:
-                return self.search_cache[query.upper()]
-            return query
+            return self.search_cache.get(query.upper(), query)
 
     def get_cached_file(self, alias: str) -> CachedFile | None:
         """Get the full cached file info by alias."""
@@ -5,9 +5,11 @@ import logging
 import os
 import re
 import ssl
+import tempfile
 import xml.etree.ElementTree as ET
 import zipfile
 from pathlib import Path
+from typing import IO
 
 from googleapiclient.errors import HttpError
 
@@ -17,6 +19,9 @@ from .api_enablement import get_api_enablement_message
 
 logger = logging.getLogger(__name__)
 
+# Drive downloads stay in memory up to this size, then spill to a temporary file.
+DOWNLOAD_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
 
 def validate_path_within_base(base_dir: str, target_path: str) -> str:
     """Validate that a target path is within the base directory (security check)."""
@@ -146,17 +151,25 @@ def check_credentials_directory_permissions(credentials_dir: str | Path | None =
         raise OSError(f"Unexpected error checking credentials directory permissions: {e}") from e
 
 
-def extract_office_xml_text(file_bytes: bytes, mime_type: str) -> str | None:
+def extract_office_xml_text(file_bytes: bytes | IO[bytes], mime_type: str) -> str | None:
     """
     Very light-weight XML scraper for Word, Excel, PowerPoint files.
     Returns plain-text if something readable is found, else None.
     No external deps – just std-lib zipfile + ElementTree.
+
+    file_bytes may also be a seekable binary file object (e.g. a spooled download),
+    which is read in place instead of being copied into memory first.
     """
     shared_strings: list[str] = []
     ns_excel_main = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
 
     try:
-        with zipfile.ZipFile(io.BytesIO(file_bytes)) as zf:
+        source: IO[bytes] = io.BytesIO(file_bytes) if isinstance(file_bytes, bytes) else file_bytes
+        if isinstance(source, tempfile.SpooledTemporaryFile):
+            # Before Python 3.11 the spool wrapper has no seekable(), which zipfile
+            # needs to open members, so read through its underlying file instead.
+            source = source._file
+        with zipfile.ZipFile(source) as zf:
             targets: list[str] = []
             # Map MIME → iterable of XML files to inspect
             if mime_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
@@ -189,13 +202,13 @@ def extract_office_xml_text(file_bytes: bytes, mime_type: str) -> str | None:
                 return None
 
             pieces: list[str] = []
+            failed_members = 0
             for member in targets:
                 try:
-                    xml_content = zf.read(member)
-                    xml_root = ET.fromstring(xml_content)
                     member_texts: list[str] = []
 
                     if mime_type == "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet":
+                        xml_root = ET.fromstring(zf.read(member))
                         for cell_element in xml_root.findall(f".//{{{ns_excel_main}}}c"):  # Find all <c> elements
                             value_element = cell_element.find(f"{{{ns_excel_main}}}v")  # Find <v> under <c>
 
@@ -220,13 +233,17 @@ def extract_office_xml_text(file_bytes: bytes, mime_type: str) -> str | None:
                             else:  # Direct value (number, boolean, inline string if not 's')
                                 member_texts.append(value_element.text)
                     else:  # Word or PowerPoint
-                        for elem in xml_root.iter():
-                            # For Word: <w:t> where w is "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-                            # For PowerPoint: <a:t> where a is "http://schemas.openxmlformats.org/drawingml/2006/main"
-                            if elem.tag.endswith("}t") and elem.text:  # Check for any namespaced tag ending with 't'
-                                cleaned_text = elem.text.strip()
-                                if cleaned_text:  # Add only if there's non-whitespace text
-                                    member_texts.append(cleaned_text)
+                        # Stream the member with iterparse and clear each element once it
+                        # ends, so the full document tree is never held in memory.
+                        with zf.open(member) as member_stream:
+                            for _, elem in ET.iterparse(member_stream, events=("end",)):
+                                # For Word: <w:t> where w is "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+                                # For PowerPoint: <a:t> where a is "http://schemas.openxmlformats.org/drawingml/2006/main"
+                                if elem.tag.endswith("}t") and elem.text:  # Any namespaced tag ending with 't'
+                                    cleaned_text = elem.text.strip()
+                                    if cleaned_text:  # Add only if there's non-whitespace text
+                                        member_texts.append(cleaned_text)
+                                elem.clear()
 
                     if member_texts:
                         pieces.append(" ".join(member_texts))  # Join texts from one member with spaces
@@ -238,9 +255,13 @@ def extract_office_xml_text(file_bytes: bytes, mime_type: str) -> str | None:
                         f"Error processing member '{member}' for {mime_type}: {e}",
                         exc_info=True,
                     )
+                    failed_members += 1
                     # continue processing other members
 
             if not pieces:  # If no text was extracted at all
+                if failed_members:
+                    # Callers fall back to a binary notice on None, so make the cause visible here
+                    logger.error(f"No text extracted from {mime_type}: {failed_members} member(s) failed to read")
                 return None
 
             # Join content from different members (sheets/slides) with double newlines for separation
@@ -178,10 +178,18 @@ def find_tables(doc_data: dict[str, Any]) -> list[dict[str, Any]]:
     Returns:
         List of table information dictionaries
     """
+    # Only table elements are parsed; paragraph text and header/footer segments
+    # from the full parse_document_structure() walk are not needed here.
     tables = []
-    structure = parse_document_structure(doc_data)
+    table_elements = (
+        element
+        for element in doc_data.get("body", {}).get("content", [])
+        if "table" in element and "paragraph" not in element
+    )
+
+    parsed_tables = (info for info in map(_parse_element, table_elements) if info is not None)
 
-    for idx, table_info in enumerate(structure["tables"]):
+    for idx, table_info in enumerate(parsed_tables):
         tables.append(
             {
                 "index": idx,
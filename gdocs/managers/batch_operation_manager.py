@@ -78,11 +78,18 @@ class BatchOperationManager:
             result = await self._execute_batch_requests(document_id, requests)
 
             # Process results
+            replies = result.get("replies", [])
             metadata = {
                 "operations_count": len(operations),
                 "requests_count": len(requests),
-                "replies_count": len(result.get("replies", [])),
+                "replies_count": len(replies),
                 "operation_summary": operation_descriptions[:5],  # First 5 operations
+                # One count per find_replace operation, in request order
+                "replacements": [
+                    reply["replaceAllText"].get("occurrencesChanged", 0)
+                    for reply in replies
+                    if "replaceAllText" in reply
+                ],
             }
 
             summary = self._build_operation_summary(operation_descriptions)
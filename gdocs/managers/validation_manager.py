@@ -477,6 +477,35 @@ class ValidationManager:
 
         return True, ""
 
+    def validate_raw_requests(self, requests: list[dict[str, Any]]) -> tuple[bool, str]:
+        """
+        Validate native Google Docs API requests for a batchUpdate body.
+
+        Only the envelope is checked (one request type per entry); field-level
+        validation is left to the Docs API.
+
+        Args:
+            requests: List of Docs API request dictionaries
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        if not requests:
+            return False, "Raw requests list cannot be empty"
+
+        if not isinstance(requests, list):
+            return False, f"Raw requests must be a list, got {type(requests).__name__}"
+
+        for i, request in enumerate(requests):
+            if not isinstance(request, dict) or len(request) != 1:
+                return False, f"Raw request {i + 1} must be a dictionary with exactly one request type key"
+
+            request_type, body = next(iter(request.items()))
+            if not isinstance(body, dict):
+                return False, f"Raw request {i + 1} ({request_type}) must map to a dictionary"
+
+        return True, ""
+
     def validate_text_content(self, text: str, max_length: int | None = None) -> tuple[bool, str]:
         """
         Validate text content for insertion.
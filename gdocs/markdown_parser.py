@@ -22,14 +22,18 @@ See Also:
 
 from __future__ import annotations
 
+import bisect
 import logging
 import re
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from markdown_it import MarkdownIt
 from mdit_py_plugins.tasklists import tasklists_plugin
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from markdown_it.token import Token
 
 logger = logging.getLogger(__name__)
@@ -69,6 +73,68 @@ HR_BORDER_WIDTH_PT = 1.0
 HR_BORDER_COLOR = {"red": 0.7, "green": 0.7, "blue": 0.7}  # #b3b3b3 light gray
 HR_PADDING_BELOW_PT = 6
 
+# Style templates built once from the constants above and shared by every
+# emitted request. Requests are only serialized downstream, never mutated.
+_CODE_BLOCK_BORDER = {
+    "color": {"color": {"rgbColor": CODE_BORDER_COLOR}},
+    "width": {"magnitude": CODE_BORDER_WIDTH_PT, "unit": "PT"},
+    "padding": {"magnitude": CODE_BORDER_PADDING_PT, "unit": "PT"},
+    "dashStyle": "SOLID",
+}
+_CODE_BLOCK_PARAGRAPH_STYLE = {
+    "shading": {"backgroundColor": {"color": {"rgbColor": CODE_BACKGROUND_COLOR}}},
+    "borderTop": _CODE_BLOCK_BORDER,
+    "borderRight": _CODE_BLOCK_BORDER,
+    "borderBottom": _CODE_BLOCK_BORDER,
+    "borderLeft": _CODE_BLOCK_BORDER,
+}
+_CODE_TEXT_STYLE = {
+    "weightedFontFamily": {
+        "fontFamily": CODE_FONT_FAMILY,
+        "weight": 400,
+    },
+    "backgroundColor": {"color": {"rgbColor": CODE_BACKGROUND_COLOR}},
+}
+_CODE_LABEL_TEXT_STYLE = {
+    "bold": True,
+    "foregroundColor": {"color": {"rgbColor": CODE_LABEL_COLOR}},
+}
+_HR_PARAGRAPH_STYLE = {
+    "borderBottom": {
+        "color": {"color": {"rgbColor": HR_BORDER_COLOR}},
+        "width": {"magnitude": HR_BORDER_WIDTH_PT, "unit": "PT"},
+        "dashStyle": "SOLID",
+        "padding": {"magnitude": HR_PADDING_BELOW_PT, "unit": "PT"},
+    },
+}
+
+# Precomputed leading-TAB prefixes for list nesting levels (index = level).
+# Deeper levels fall back to string multiplication.
+_TAB_PREFIXES: tuple[str, ...] = tuple("\t" * level for level in range(8))
+
+# Shared single-key inline styles pushed for strong/em/s tokens. These are
+# treated as read-only: _merge_deferred_styles copies before merging.
+_STYLE_BOLD: dict = {"bold": True}
+_STYLE_ITALIC: dict = {"italic": True}
+_STYLE_STRIKETHROUGH: dict = {"strikethrough": True}
+
+# Bit flags for the shared boolean styles (keyed by identity). Ranges carrying
+# several of them are merged with a bitwise OR, and the resulting textStyle and
+# fields mask are looked up in _FLAG_STYLE_TABLE instead of rebuilt per range.
+_FLAG_STYLE_NAMES: tuple[str, ...] = ("bold", "italic", "strikethrough")  # bit i -> name
+_STYLE_FLAG_BITS: dict[int, int] = {
+    id(_STYLE_BOLD): 1,
+    id(_STYLE_ITALIC): 2,
+    id(_STYLE_STRIKETHROUGH): 4,
+}
+_FLAG_STYLE_TABLE: tuple[tuple[dict, str], ...] = tuple(
+    (dict.fromkeys(names, True), ",".join(names))
+    for names in (
+        [name for i, name in enumerate(_FLAG_STYLE_NAMES) if bits >> i & 1]
+        for bits in range(1 << len(_FLAG_STYLE_NAMES))
+    )
+)
+
 # Task list checkbox characters (Unicode ballot box symbols)
 CHECKBOX_UNCHECKED = "☐"  # U+2610 BALLOT BOX
 CHECKBOX_CHECKED = "☑"  # U+2611 BALLOT BOX WITH CHECK
@@ -87,6 +153,14 @@ MENTION_MODES = {"text", "person_chip"}
 # @user@example.com mention token matcher used in person-chip mode.
 PERSON_MENTION_PATTERN = re.compile(r"(?<![\w@])@([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})(?![\w@])")
 
+# Task list checkbox emitted by mdit_py_plugins.tasklists as an html_inline token:
+# <input class="task-list-item-checkbox" [checked="checked" ]disabled="disabled" type="checkbox">
+# Group 1 is set for checked items.
+TASK_CHECKBOX_PATTERN = re.compile(r'<input\b(?=[^>]*\bclass="task-list-item-checkbox")(?:[^>]*?(checked="checked"))?')
+
+# TAB matcher used to index TAB offsets for bullet index adjustment.
+_TAB_PATTERN = re.compile("\t")
+
 # Top-level block tokens whose source line maps are used to preserve explicit
 # blank lines from markdown input (e.g. spacing around headings/hr blocks).
 SOURCE_GAP_TRACKED_TOKEN_TYPES = {
@@ -101,6 +175,34 @@ SOURCE_GAP_TRACKED_TOKEN_TYPES = {
     "hr",
 }
 
+# CommonMark base with GFM-style extensions:
+# - table: GFM tables (MARKDOWN_STEP_3_TABLES.md)
+# - strikethrough: ~~text~~ syntax (Task 6.2)
+# - tasklists: [ ] and [x] checkboxes (Task 6.4)
+# Parser configuration does not depend on converter options, so one instance is shared.
+_SHARED_MARKDOWN_PARSER = MarkdownIt("commonmark").enable("table").enable("strikethrough").use(tasklists_plugin)
+
+# Number of distinct markdown inputs whose token streams are memoized.
+PARSE_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_markdown_cached(markdown_text: str) -> tuple[Token, ...]:
+    """
+    Parse markdown with the shared parser, memoizing the token stream per input.
+
+    Retries and repeated conversions of the same text (e.g. dry run followed by
+    the real call) reuse the tokens. The converter only reads tokens, so sharing
+    them between conversions is safe.
+    """
+    return tuple(_SHARED_MARKDOWN_PARSER.parse(markdown_text))
+
+
+@lru_cache(maxsize=64)
+def _fields_mask(style_keys: tuple[str, ...]) -> str:
+    """Join textStyle keys into an updateTextStyle fields mask (few distinct key sets occur)."""
+    return ",".join(style_keys)
+
 
 class MarkdownToDocsConverter:
     """
@@ -144,11 +246,7 @@ class MarkdownToDocsConverter:
             )
         self.checklist_mode = checklist_mode
         self.mention_mode = mention_mode
-        # CommonMark base with GFM-style extensions:
-        # - table: GFM tables (MARKDOWN_STEP_3_TABLES.md)
-        # - strikethrough: ~~text~~ syntax (Task 6.2)
-        # - tasklists: [ ] and [x] checkboxes (Task 6.4)
-        self.md = MarkdownIt("commonmark").enable("table").enable("strikethrough").use(tasklists_plugin)
+        self.md = _SHARED_MARKDOWN_PARSER
         self.requests: list[dict] = []
         self.cursor_index: int = 1
         self.active_styles: list[dict] = []
@@ -189,17 +287,28 @@ class MarkdownToDocsConverter:
         self._in_table: bool = False
         self._table_data: list[list[str]] = []  # 2D array: rows of cells
         self._current_row: list[str] = []  # Current row being built
-        self._current_cell_content: str = ""  # Current cell text being collected
+        self._current_cell_chunks: list[str] = []  # Text runs of the cell being collected
         self._in_table_cell: bool = False  # True when inside th/td
         # Single-Insert Architecture (FIX_STYLE_BLEED.md v5)
         # Instead of inserting text fragments sequentially (which causes style bleeding),
         # we buffer all text and track styles as ranges. At convert() end:
         # 1. One insertText with the entire buffer
         # 2. updateTextStyle for each tracked range
-        self._text_buffer: str = ""  # All text accumulated during parsing
+        # Text is accumulated as a list of chunks and joined lazily (see _text_buffer);
+        # repeated `str +=` on an attribute cannot resize in place and copies the
+        # whole buffer on every append.
+        self._text_chunks: list[str] = []  # All text accumulated during parsing
+        self._text_len: int = 0  # Total length of _text_chunks
+        # Sorted TAB offsets in the buffer, rebuilt when _text_len changes (see _count_tabs)
+        self._tab_positions: list[int] = []
+        self._tab_index_len: int = 0
         self._deferred_styles: list[tuple[int, int, dict]] = []  # (start, end, style)
+        # Link styles interned per URL so repeated links share one (read-only) style dict
+        self._link_styles: dict[str, dict] = {}
         # Track where each style started (for when style_open happens)
-        self._style_start_positions: list[tuple[int, dict]] = []  # (buffer_position, style)
+        # Kept as parallel stacks (offset, style) to avoid a tuple per push.
+        self._style_start_offsets: list[int] = []  # buffer position where each style opened
+        self._style_start_styles: list[dict] = []
         # Table data for post-processing (populated during convert())
         # Each entry is (table_data_2d, bold_headers) for one table found in the markdown
         self.pending_tables: list[tuple[list[list[str]], bool]] = []
@@ -254,11 +363,16 @@ class MarkdownToDocsConverter:
         self._in_table = False
         self._table_data = []
         self._current_row = []
-        self._current_cell_content = ""
+        self._current_cell_chunks = []
         self._in_table_cell = False
-        self._text_buffer = ""
+        self._text_chunks = []
+        self._text_len = 0
+        self._tab_positions = []
+        self._tab_index_len = 0
         self._deferred_styles = []
-        self._style_start_positions = []
+        self._link_styles = {}
+        self._style_start_offsets = []
+        self._style_start_styles = []
         self.pending_tables = []
         self.pending_person_mentions = []
         self._pending_table_insertions = []
@@ -266,7 +380,11 @@ class MarkdownToDocsConverter:
         self._strip_next_task_text_space = False
         self._last_tracked_block_end_line = None
 
-        tokens: list[Token] = self.md.parse(markdown_text)
+        tokens: Sequence[Token]
+        if self.md is _SHARED_MARKDOWN_PARSER:
+            tokens = _parse_markdown_cached(markdown_text)
+        else:
+            tokens = self.md.parse(markdown_text)
 
         for token in tokens:
             self._insert_source_blank_lines(token)
@@ -276,11 +394,12 @@ class MarkdownToDocsConverter:
         # Insert ALL text in one request, then apply styles separately.
         # This prevents Google Docs API from inheriting styles between fragments.
         insert_requests: list[dict] = []
-        if self._text_buffer:
+        text_buffer = self._text_buffer
+        if text_buffer:
             insert_requests.append(
                 {
                     "insertText": {
-                        "text": self._text_buffer,
+                        "text": text_buffer,
                         "location": {"index": start_index},
                     }
                 }
@@ -290,7 +409,7 @@ class MarkdownToDocsConverter:
         merged_styles = self._merge_deferred_styles()
 
         deferred_style_requests: list[dict] = []
-        for rel_start, rel_end, style in merged_styles:
+        for rel_start, rel_end, style, fields in merged_styles:
             abs_start = start_index + rel_start
             abs_end = start_index + rel_end
             deferred_style_requests.append(
@@ -298,7 +417,7 @@ class MarkdownToDocsConverter:
                     "updateTextStyle": {
                         "range": {"startIndex": abs_start, "endIndex": abs_end},
                         "textStyle": style,
-                        "fields": self._get_style_fields(style),
+                        "fields": fields,
                     }
                 }
             )
@@ -339,51 +458,50 @@ class MarkdownToDocsConverter:
         Note:
             Token handlers are implemented incrementally in Phase 1 tasks.
         """
-        logger.debug(f"Token: type={token.type}, tag={token.tag}, nesting={token.nesting}")
-
-        if token.type == "inline":
+        token_type = token.type
+        if token_type == "inline":
             self._handle_inline(token)
-        elif token.type == "paragraph_close":
+        elif token_type == "paragraph_close":
             self._handle_paragraph_close()
-        elif token.type == "heading_open":
+        elif token_type == "heading_open":
             self._handle_heading_open(token)
-        elif token.type == "heading_close":
+        elif token_type == "heading_close":
             self._handle_heading_close(token)
-        elif token.type == "bullet_list_open":
+        elif token_type == "bullet_list_open":
             self._handle_list_open("bullet")
-        elif token.type == "bullet_list_close":
+        elif token_type == "bullet_list_close":
             self._handle_list_close()
-        elif token.type == "ordered_list_open":
+        elif token_type == "ordered_list_open":
             self._handle_list_open("ordered")
-        elif token.type == "ordered_list_close":
+        elif token_type == "ordered_list_close":
             self._handle_list_close()
-        elif token.type == "list_item_open":
+        elif token_type == "list_item_open":
             self._handle_list_item_open()
-        elif token.type == "list_item_close":
+        elif token_type == "list_item_close":
             self._handle_list_item_close()
-        elif token.type == "fence":
+        elif token_type == "fence":
             self._handle_code_block(token)
-        elif token.type == "code_block":
+        elif token_type == "code_block":
             self._handle_code_block(token)
-        elif token.type == "blockquote_open":
+        elif token_type == "blockquote_open":
             self._handle_blockquote_open()
-        elif token.type == "blockquote_close":
+        elif token_type == "blockquote_close":
             self._handle_blockquote_close()
-        elif token.type == "paragraph_open":
+        elif token_type == "paragraph_open":
             self._handle_paragraph_open()
-        elif token.type == "table_open":
+        elif token_type == "table_open":
             self._handle_table_open()
-        elif token.type == "table_close":
+        elif token_type == "table_close":
             self._handle_table_close()
-        elif token.type == "tr_open":
+        elif token_type == "tr_open":
             self._handle_tr_open()
-        elif token.type == "tr_close":
+        elif token_type == "tr_close":
             self._handle_tr_close()
-        elif token.type in ("th_open", "td_open"):
+        elif token_type in ("th_open", "td_open"):
             self._handle_cell_open()
-        elif token.type in ("th_close", "td_close"):
+        elif token_type in ("th_close", "td_close"):
             self._handle_cell_close()
-        elif token.type == "hr":
+        elif token_type == "hr":
             self._handle_horizontal_rule()
 
     def _insert_source_blank_lines(self, token: Token) -> None:
@@ -408,9 +526,9 @@ class MarkdownToDocsConverter:
 
         start_line, end_line = token_map
         if self._last_tracked_block_end_line is not None:
-            blank_lines = max(0, start_line - self._last_tracked_block_end_line)
-            for _ in range(blank_lines):
-                self._insert_newline()
+            blank_lines = start_line - self._last_tracked_block_end_line
+            if blank_lines > 0:
+                self._insert_text("\n" * blank_lines)
 
         self._last_tracked_block_end_line = end_line
 
@@ -432,58 +550,70 @@ class MarkdownToDocsConverter:
             - Follows the "Index Tracker" pattern from
               `agent-docs/archive/legacy-root/IMPLEMENTATION_PLAN_MARKDOWN.md`:L136-168
         """
-        if not token.children:
+        children = token.children
+        if not children:
             return
 
-        for child in token.children:
-            logger.debug(f"  Child: type={child.type}, content={child.content!r}")
-
-            if child.type == "text":
-                if self._in_table_cell:
-                    self._current_cell_content += child.content
+        # Hoist hot attribute loads out of the per-child loop. Table-cell state only
+        # changes on block-level tokens, so it is stable for the whole inline run.
+        in_table_cell = self._in_table_cell
+        insert_text = self._insert_text
+        push_style = self._push_style
+        pop_style = self._pop_style
+        person_chip_mode = self.mention_mode == "person_chip"
+        link_styles = self._link_styles
+
+        for child in children:
+            child_type = child.type
+            if child_type == "text":
+                if in_table_cell:
+                    self._current_cell_chunks.append(child.content)
                 else:
                     text_content = child.content
                     if self._strip_next_task_text_space:
                         text_content = text_content[1:] if text_content.startswith(" ") else text_content
                         self._strip_next_task_text_space = False
-                    if self.mention_mode == "person_chip":
+                    if person_chip_mode:
                         self._insert_text_with_person_mentions(text_content)
                     else:
-                        self._insert_text(text_content)
-            elif child.type == "softbreak":
+                        insert_text(text_content)
+            elif child_type == "softbreak":
                 # Soft line breaks become spaces in Google Docs
-                self._insert_text(" ")
-            elif child.type == "hardbreak":
-                self._insert_text("\n")
-            elif child.type == "strong_open":
-                self._push_style({"bold": True})
-            elif child.type == "strong_close":
-                self._pop_style({"bold": True})
-            elif child.type == "em_open":
-                self._push_style({"italic": True})
-            elif child.type == "em_close":
-                self._pop_style({"italic": True})
-            elif child.type == "link_open":
-                href = child.attrs.get("href", "") if isinstance(child.attrs, dict) else ""
-                self._push_style({"link": {"url": href}})
-            elif child.type == "link_close":
+                insert_text(" ")
+            elif child_type == "hardbreak":
+                insert_text("\n")
+            elif child_type == "strong_open":
+                push_style(_STYLE_BOLD)
+            elif child_type == "strong_close":
+                pop_style(_STYLE_BOLD)
+            elif child_type == "em_open":
+                push_style(_STYLE_ITALIC)
+            elif child_type == "em_close":
+                pop_style(_STYLE_ITALIC)
+            elif child_type == "link_open":
+                href = str(child.attrs.get("href", "")) if isinstance(child.attrs, dict) else ""
+                link_style = link_styles.get(href)
+                if link_style is None:
+                    link_style = link_styles[href] = {"link": {"url": href}}
+                push_style(link_style)
+            elif child_type == "link_close":
                 self._pop_link_style()
-            elif child.type == "code_inline":
+            elif child_type == "code_inline":
                 self._handle_code_inline(child)
-            elif child.type == "s_open":
-                self._push_style({"strikethrough": True})
-            elif child.type == "s_close":
-                self._pop_style({"strikethrough": True})
-            elif child.type == "image":
+            elif child_type == "s_open":
+                push_style(_STYLE_STRIKETHROUGH)
+            elif child_type == "s_close":
+                pop_style(_STYLE_STRIKETHROUGH)
+            elif child_type == "image":
                 self._handle_image(child)
-            elif child.type == "html_inline":
+            elif child_type == "html_inline":
                 self._handle_html_inline(child)
 
     def _insert_text(self, text: str) -> None:
         """
         Buffer text for single-insert and advance cursor.
 
-        Text is accumulated in _text_buffer. Styles are tracked via _push_style/_pop_style
+        Text is accumulated in _text_chunks. Styles are tracked via _push_style/_pop_style
         and recorded as ranges in _deferred_styles. The actual insertText request is
         generated in convert() after all text is buffered.
 
@@ -499,26 +629,44 @@ class MarkdownToDocsConverter:
         if self._list_item_start_index is not None and not self._list_item_tabs_inserted:
             nesting_level = len(self._list_type_stack) - 1
             if nesting_level > 0:
-                tabs = "\t" * nesting_level
-                self._text_buffer += tabs
-                self.cursor_index += len(tabs)
-                logger.debug(f"Inserted {nesting_level} TAB(s) for list nesting")
+                tabs = _TAB_PREFIXES[nesting_level] if nesting_level < len(_TAB_PREFIXES) else "\t" * nesting_level
+                text = tabs + text
+                logger.debug("Inserted %d TAB(s) for list nesting", nesting_level)
             self._list_item_tabs_inserted = True
 
-        self._text_buffer += text
+        self._text_chunks.append(text)
+        self._text_len += len(text)
         self.cursor_index += len(text)
-        logger.debug(f"Buffered text: {text!r}, buffer_len={len(self._text_buffer)}, cursor={self.cursor_index}")
+
+    @property
+    def _text_buffer(self) -> str:
+        """
+        Return all buffered text as a single string.
+
+        The chunk list is collapsed in place so repeated reads after parsing
+        (index adjustment passes) do not re-join the whole buffer.
+        """
+        chunks = self._text_chunks
+        if len(chunks) > 1:
+            chunks[:] = ["".join(chunks)]
+        return chunks[0] if chunks else ""
 
     def _insert_newline(self) -> None:
         """Insert a newline character at the current cursor position."""
-        self._insert_text("\n")
+        if self._list_item_start_index is not None and not self._list_item_tabs_inserted:
+            # First insert of a list item: let _insert_text add the nesting TABs.
+            self._insert_text("\n")
+            return
+        self._text_chunks.append("\n")
+        self._text_len += 1
+        self.cursor_index += 1
 
     def _handle_paragraph_open(self) -> None:
         """Track paragraph start for blockquote styling and list bleed prevention."""
         self._paragraph_start_index = self.cursor_index
         if self._blockquote_nesting_level > 0:
             self._blockquote_paragraph_start_index = self.cursor_index
-            logger.debug(f"Paragraph open in blockquote: start_index={self.cursor_index}")
+            logger.debug("Paragraph open in blockquote: start_index=%d", self.cursor_index)
 
     def _handle_paragraph_close(self) -> None:
         """
@@ -552,7 +700,7 @@ class MarkdownToDocsConverter:
         self._list_type_stack.append(list_type)
         self._in_list_block = True
         self._just_exited_list = False
-        logger.debug(f"List open: type={list_type}, nesting_level={len(self._list_type_stack) - 1}")
+        logger.debug("List open: type=%s, nesting_level=%d", list_type, len(self._list_type_stack) - 1)
 
     def _handle_list_close(self) -> None:
         """
@@ -567,7 +715,7 @@ class MarkdownToDocsConverter:
                 emitted_bullets = self._apply_top_level_list_bullets()
                 self._in_list_block = False
                 self._just_exited_list = emitted_bullets
-            logger.debug(f"List close: type={popped}, nesting_level={len(self._list_type_stack)}")
+            logger.debug("List close: type=%s, nesting_level=%d", popped, len(self._list_type_stack))
         else:
             logger.warning("list_close without matching list_open")
 
@@ -580,7 +728,7 @@ class MarkdownToDocsConverter:
         """
         self._list_item_start_index = self.cursor_index
         self._list_item_tabs_inserted = False
-        logger.debug(f"List item open: start_index={self._list_item_start_index}")
+        logger.debug("List item open: start_index=%d", self._list_item_start_index)
 
     def _handle_list_item_close(self) -> None:
         """
@@ -610,7 +758,7 @@ class MarkdownToDocsConverter:
             }
             self.requests.append(request)
             self._just_exited_list = False
-            logger.debug(f"Emitted deleteParagraphBullets for range [{start_index}, {end_index})")
+            logger.debug("Emitted deleteParagraphBullets for range [%d, %d)", start_index, end_index)
 
     def _apply_top_level_list_bullets(self) -> bool:
         """
@@ -644,7 +792,7 @@ class MarkdownToDocsConverter:
         # Exclude the list-closing newline from the bullet range to avoid
         # rendering an extra empty bullet paragraph after task/list blocks.
         end_index = self.cursor_index
-        if self._text_buffer.endswith("\n"):
+        if self._text_chunks and self._text_chunks[-1].endswith("\n"):
             end_index = max(self._top_level_list_start_index + 1, self.cursor_index - 1)
 
         request = {
@@ -659,8 +807,10 @@ class MarkdownToDocsConverter:
         self.requests.append(request)
 
         logger.debug(
-            f"Applied bullets to entire list: preset={bullet_preset}, "
-            f"range=[{self._top_level_list_start_index}, {end_index})"
+            "Applied bullets to entire list: preset=%s, range=[%d, %d)",
+            bullet_preset,
+            self._top_level_list_start_index,
+            end_index,
         )
 
         self._top_level_list_start_index = None
@@ -671,13 +821,13 @@ class MarkdownToDocsConverter:
     def _handle_blockquote_open(self) -> None:
         """Increment blockquote nesting level."""
         self._blockquote_nesting_level += 1
-        logger.debug(f"Blockquote open: nesting_level={self._blockquote_nesting_level}")
+        logger.debug("Blockquote open: nesting_level=%d", self._blockquote_nesting_level)
 
     def _handle_blockquote_close(self) -> None:
         """Decrement blockquote nesting level."""
         if self._blockquote_nesting_level > 0:
             self._blockquote_nesting_level -= 1
-            logger.debug(f"Blockquote close: nesting_level={self._blockquote_nesting_level}")
+            logger.debug("Blockquote close: nesting_level=%d", self._blockquote_nesting_level)
         else:
             logger.warning("blockquote_close without matching blockquote_open")
 
@@ -718,17 +868,17 @@ class MarkdownToDocsConverter:
         }
         self.requests.append(paragraph_request)
 
-        text_style_request = {
-            "updateTextStyle": {
-                "range": {"startIndex": start_idx, "endIndex": end_idx},
-                "textStyle": {"italic": True},
-                "fields": "italic",
-            }
-        }
-        self.requests.append(text_style_request)
+        # Route the italic through the deferred style ranges so it coalesces with
+        # inline styles covering the same range instead of adding a request.
+        buffer_offset = self.cursor_index - self._text_len
+        if end_idx > start_idx:
+            self._deferred_styles.append((start_idx - buffer_offset, end_idx - buffer_offset, _STYLE_ITALIC))
 
         logger.debug(
-            f"Applied blockquote style: margin={margin_pt}PT, borderLeft, italic=True, range=[{start_idx}, {end_idx})"
+            "Applied blockquote style: margin=%dPT, borderLeft, italic=True, range=[%d, %d)",
+            margin_pt,
+            start_idx,
+            end_idx,
         )
 
     def _handle_table_open(self) -> None:
@@ -736,7 +886,7 @@ class MarkdownToDocsConverter:
         self._in_table = True
         self._table_data = []
         self._current_row = []
-        self._current_cell_content = ""
+        self._current_cell_chunks = []
         self._in_table_cell = False
         logger.debug("Table open: started buffering")
 
@@ -767,7 +917,7 @@ class MarkdownToDocsConverter:
             while len(row) < cols:
                 row.append("")
 
-        placeholder_pos = len(self._text_buffer)
+        placeholder_pos = self._text_len
         self._insert_text(TABLE_PLACEHOLDER_CHAR)
         self._pending_table_insertions.append((placeholder_pos, rows, cols))
         logger.debug(
@@ -790,7 +940,7 @@ class MarkdownToDocsConverter:
         self._in_table = False
         self._table_data = []
         self._current_row = []
-        self._current_cell_content = ""
+        self._current_cell_chunks = []
         self._in_table_cell = False
 
     def _handle_tr_open(self) -> None:
@@ -802,51 +952,23 @@ class MarkdownToDocsConverter:
         """Complete the current row and add to table data."""
         if self._current_row:
             self._table_data.append(self._current_row)
-            logger.debug(f"Table row close: added row with {len(self._current_row)} cells")
+            logger.debug("Table row close: added row with %d cells", len(self._current_row))
         self._current_row = []
 
     def _handle_cell_open(self) -> None:
         """Start collecting content for a table cell."""
         self._in_table_cell = True
-        self._current_cell_content = ""
+        self._current_cell_chunks = []
         logger.debug("Table cell open")
 
     def _handle_cell_close(self) -> None:
         """Complete the current cell and add to current row."""
-        self._current_row.append(self._current_cell_content)
-        logger.debug(f"Table cell close: content={self._current_cell_content!r}")
-        self._current_cell_content = ""
+        cell_content = "".join(self._current_cell_chunks)
+        self._current_row.append(cell_content)
+        logger.debug("Table cell close: content=%r", cell_content)
+        self._current_cell_chunks = []
         self._in_table_cell = False
 
-    def _apply_header_bold_style(self, table_start_index: int, cols: int) -> None:
-        """Apply bold formatting to each cell in the first table row."""
-        if not self._table_data or not any(self._table_data[0]):
-            return
-
-        header_offset = 0
-        for c, cell_text in enumerate(self._table_data[0]):
-            if not cell_text:
-                continue
-
-            base_cell_index = table_start_index + 3 + c * 2
-            cell_start = base_cell_index + header_offset
-            cell_end = cell_start + len(cell_text)
-
-            bold_request = {
-                "updateTextStyle": {
-                    "range": {
-                        "startIndex": cell_start,
-                        "endIndex": cell_end,
-                    },
-                    "textStyle": {"bold": True},
-                    "fields": "bold",
-                }
-            }
-            self.requests.append(bold_request)
-            logger.debug(f"Applied bold to header cell (0,{c}): range [{cell_start}, {cell_end})")
-
-            header_offset += len(cell_text)
-
     def _handle_heading_open(self, token: Token) -> None:
         """
         Start tracking a heading block.
@@ -857,7 +979,7 @@ class MarkdownToDocsConverter:
         """
         self._current_heading_tag = token.tag
         self._heading_start_index = self.cursor_index
-        logger.debug(f"Heading open: tag={token.tag}, start_index={self.cursor_index}")
+        logger.debug("Heading open: tag=%s, start_index=%d", token.tag, self.cursor_index)
 
     def _handle_heading_close(self, token: Token) -> None:
         """
@@ -889,7 +1011,9 @@ class MarkdownToDocsConverter:
             }
         }
         self.requests.append(request)
-        logger.debug(f"Applied heading style {named_style} to range [{self._heading_start_index}, {self.cursor_index})")
+        logger.debug(
+            "Applied heading style %s to range [%d, %d)", named_style, self._heading_start_index, self.cursor_index
+        )
 
         self._insert_newline()
         self._current_heading_tag = None
@@ -915,20 +1039,13 @@ class MarkdownToDocsConverter:
                     "startIndex": start_index,
                     "endIndex": self.cursor_index,
                 },
-                "paragraphStyle": {
-                    "borderBottom": {
-                        "color": {"color": {"rgbColor": HR_BORDER_COLOR}},
-                        "width": {"magnitude": HR_BORDER_WIDTH_PT, "unit": "PT"},
-                        "dashStyle": "SOLID",
-                        "padding": {"magnitude": HR_PADDING_BELOW_PT, "unit": "PT"},
-                    },
-                },
+                "paragraphStyle": _HR_PARAGRAPH_STYLE,
                 "fields": "borderBottom",
             }
         }
         self.requests.append(paragraph_style_request)
 
-        logger.debug(f"Inserted horizontal rule at index {start_index}")
+        logger.debug("Inserted horizontal rule at index %d", start_index)
 
     def _handle_code_block(self, token: Token) -> None:
         """
@@ -947,25 +1064,21 @@ class MarkdownToDocsConverter:
         label_range: tuple[int, int] | None = None
 
         if language:
-            label_start = len(self._text_buffer)
+            label_start = self._text_len
             self._insert_text(language)
-            label_end = len(self._text_buffer)
+            label_end = self._text_len
             label_range = (label_start, label_end)
             self._insert_newline()
 
-        code_buffer_start = len(self._text_buffer)
+        code_buffer_start = self._text_len
         if content:
             self._insert_text(content)
-        code_buffer_end = len(self._text_buffer)
+        code_buffer_end = self._text_len
 
         self._emit_delete_paragraph_bullets_if_needed(start_idx, self.cursor_index)
 
         if label_range is not None:
-            label_style = {
-                "bold": True,
-                "foregroundColor": {"color": {"rgbColor": CODE_LABEL_COLOR}},
-            }
-            self._deferred_styles.append((label_range[0], label_range[1], label_style))
+            self._deferred_styles.append((label_range[0], label_range[1], _CODE_LABEL_TEXT_STYLE))
 
         paragraph_style_request = {
             "updateParagraphStyle": {
@@ -973,47 +1086,14 @@ class MarkdownToDocsConverter:
                     "startIndex": start_idx,
                     "endIndex": self.cursor_index,
                 },
-                "paragraphStyle": {
-                    "shading": {"backgroundColor": {"color": {"rgbColor": CODE_BACKGROUND_COLOR}}},
-                    "borderTop": {
-                        "color": {"color": {"rgbColor": CODE_BORDER_COLOR}},
-                        "width": {"magnitude": CODE_BORDER_WIDTH_PT, "unit": "PT"},
-                        "padding": {"magnitude": CODE_BORDER_PADDING_PT, "unit": "PT"},
-                        "dashStyle": "SOLID",
-                    },
-                    "borderRight": {
-                        "color": {"color": {"rgbColor": CODE_BORDER_COLOR}},
-                        "width": {"magnitude": CODE_BORDER_WIDTH_PT, "unit": "PT"},
-                        "padding": {"magnitude": CODE_BORDER_PADDING_PT, "unit": "PT"},
-                        "dashStyle": "SOLID",
-                    },
-                    "borderBottom": {
-                        "color": {"color": {"rgbColor": CODE_BORDER_COLOR}},
-                        "width": {"magnitude": CODE_BORDER_WIDTH_PT, "unit": "PT"},
-                        "padding": {"magnitude": CODE_BORDER_PADDING_PT, "unit": "PT"},
-                        "dashStyle": "SOLID",
-                    },
-                    "borderLeft": {
-                        "color": {"color": {"rgbColor": CODE_BORDER_COLOR}},
-                        "width": {"magnitude": CODE_BORDER_WIDTH_PT, "unit": "PT"},
-                        "padding": {"magnitude": CODE_BORDER_PADDING_PT, "unit": "PT"},
-                        "dashStyle": "SOLID",
-                    },
-                },
+                "paragraphStyle": _CODE_BLOCK_PARAGRAPH_STYLE,
                 "fields": "shading,borderTop,borderRight,borderBottom,borderLeft",
             }
         }
         self.requests.append(paragraph_style_request)
 
-        code_style = {
-            "weightedFontFamily": {
-                "fontFamily": CODE_FONT_FAMILY,
-                "weight": 400,
-            },
-            "backgroundColor": {"color": {"rgbColor": CODE_BACKGROUND_COLOR}},
-        }
         if code_buffer_end > code_buffer_start:
-            self._deferred_styles.append((code_buffer_start, code_buffer_end, code_style))
+            self._deferred_styles.append((code_buffer_start, code_buffer_end, _CODE_TEXT_STYLE))
 
         logger.debug(
             "Buffered code block: language=%r, content_chars=%d, code_range=[%d, %d), abs_range=[%d, %d)",
@@ -1050,20 +1130,13 @@ class MarkdownToDocsConverter:
         if not content:
             return
 
-        buffer_start = len(self._text_buffer)
+        buffer_start = self._text_len
         self._insert_text(content)
-        buffer_end = len(self._text_buffer)
-
-        code_style = {
-            "weightedFontFamily": {
-                "fontFamily": CODE_FONT_FAMILY,
-                "weight": 400,
-            },
-            "backgroundColor": {"color": {"rgbColor": CODE_BACKGROUND_COLOR}},
-        }
-        self._deferred_styles.append((buffer_start, buffer_end, code_style))
+        buffer_end = self._text_len
+
+        self._deferred_styles.append((buffer_start, buffer_end, _CODE_TEXT_STYLE))
 
-        logger.debug(f"Buffered inline code: {content!r}, buffer range [{buffer_start}, {buffer_end})")
+        logger.debug("Buffered inline code: %r, buffer range [%d, %d)", content, buffer_start, buffer_end)
 
     def _handle_image(self, token: Token) -> None:
         """
@@ -1081,18 +1154,10 @@ class MarkdownToDocsConverter:
         Args:
             token: An image token containing src in attrs and alt text in children.
         """
-        # Extract src from token.attrs (can be dict or list of tuples)
-        src: str = ""
-        if isinstance(token.attrs, dict):
-            src_value = token.attrs.get("src", "")
-            if isinstance(src_value, str):
-                src = src_value
-        elif token.attrs:
-            # markdown-it-py sometimes uses list of [key, value] pairs
-            attrs_dict = dict(token.attrs)
-            src_value = attrs_dict.get("src", "")
-            if isinstance(src_value, str):
-                src = src_value
+        # markdown-it-py >= 3 normalizes token.attrs to a dict, including when a
+        # Token is constructed with a list of [key, value] pairs.
+        src_value = token.attrs.get("src")
+        src: str = src_value if isinstance(src_value, str) else ""
 
         if not src:
             logger.warning("Image token missing 'src' attribute, skipping")
@@ -1101,7 +1166,7 @@ class MarkdownToDocsConverter:
         # Buffer a placeholder char and register deferred image insertion.
         # This guarantees the target paragraph/index exists after the single
         # insertText request, then we replace placeholder -> image deterministically.
-        placeholder_pos = len(self._text_buffer)
+        placeholder_pos = self._text_len
         self._insert_text(IMAGE_PLACEHOLDER_CHAR)
         self._pending_inline_images.append((placeholder_pos, src))
         logger.debug(
@@ -1124,33 +1189,34 @@ class MarkdownToDocsConverter:
         if not content:
             return
 
-        # Detect task list checkbox HTML from mdit_py_plugins.tasklists
-        # Format: <input class="task-list-item-checkbox" disabled="disabled" type="checkbox">
-        # or with checked="checked" for checked items
+        # Detect task list checkbox HTML from mdit_py_plugins.tasklists (TASK_CHECKBOX_PATTERN).
+        # Any other inline HTML is rejected by the cheap prefix check before the regex runs.
         # Note: The following text token already has a leading space, so we don't add one
-        if 'class="task-list-item-checkbox"' in content:
+        checkbox_match = TASK_CHECKBOX_PATTERN.match(content) if content.startswith("<input") else None
+        if checkbox_match is not None:
             if self.checklist_mode == "native":
                 if self._list_type_stack:
                     self._top_level_list_has_task_items = True
                 self._strip_next_task_text_space = True
                 logger.debug("Detected task list checkbox in native checklist mode")
             else:
-                checkbox_char = CHECKBOX_CHECKED if 'checked="checked"' in content else CHECKBOX_UNCHECKED
+                checkbox_char = CHECKBOX_CHECKED if checkbox_match.group(1) else CHECKBOX_UNCHECKED
                 self._insert_text(checkbox_char)
                 if self._list_type_stack:
                     self._top_level_list_has_task_items = True
-                logger.debug(f"Inserted task list checkbox: {checkbox_char!r}")
+                logger.debug("Inserted task list checkbox: %r", checkbox_char)
         else:
             # For other HTML inline elements, insert as plain text
             # This preserves any raw HTML the user may have included
             self._insert_text(content)
-            logger.debug(f"Inserted raw HTML inline: {content!r}")
+            logger.debug("Inserted raw HTML inline: %r", content)
 
     def _push_style(self, style: dict) -> None:
         """Push a style dict onto the active_styles stack and record start position."""
         self.active_styles.append(style)
-        self._style_start_positions.append((len(self._text_buffer), style))
-        logger.debug(f"Pushed style: {style}, buffer_pos: {len(self._text_buffer)}")
+        self._style_start_offsets.append(self._text_len)
+        self._style_start_styles.append(style)
+        logger.debug("Pushed style: %s, buffer_pos: %d", style, self._text_len)
 
     def _pop_style(self, expected_style: dict) -> None:
         """Pop style from stack and record the completed range for deferred application."""
@@ -1158,41 +1224,51 @@ class MarkdownToDocsConverter:
             logger.warning(f"Attempted to pop style {expected_style} from empty stack")
             return
         popped = self.active_styles.pop()
-        if popped != expected_style:
+        if popped is not expected_style and popped != expected_style:
             logger.warning(f"Style mismatch: expected {expected_style}, got {popped}")
 
-        for i in range(len(self._style_start_positions) - 1, -1, -1):
-            start_pos, start_style = self._style_start_positions[i]
-            if start_style == popped:
-                self._style_start_positions.pop(i)
-                end_pos = len(self._text_buffer)
-                if end_pos > start_pos:
-                    self._deferred_styles.append((start_pos, end_pos, popped))
-                    logger.debug(f"Deferred style: {popped}, range [{start_pos}, {end_pos})")
-                break
-        else:
+        # Well-nested markdown closes styles in LIFO order, so the matching start
+        # is normally on top of the stack; only scan on mismatched nesting.
+        start_styles = self._style_start_styles
+        i = len(start_styles) - 1
+        if i >= 0 and start_styles[i] is not popped:
+            i = next((j for j in range(i, -1, -1) if start_styles[j] == popped), -1)
+        if i < 0:
             logger.warning(f"No start position found for style {popped}")
+            return
+
+        del start_styles[i]
+        self._record_deferred_style(self._style_start_offsets.pop(i), popped)
 
     def _pop_link_style(self) -> None:
         """Pop a link style from the stack and record deferred style range."""
-        if not self.active_styles:
+        active_styles = self.active_styles
+        if not active_styles:
             logger.warning("Attempted to pop link style from empty stack")
             return
-        for i in range(len(self.active_styles) - 1, -1, -1):
-            if "link" in self.active_styles[i]:
-                popped = self.active_styles.pop(i)
-                for j in range(len(self._style_start_positions) - 1, -1, -1):
-                    start_pos, start_style = self._style_start_positions[j]
-                    if "link" in start_style:
-                        self._style_start_positions.pop(j)
-                        end_pos = len(self._text_buffer)
-                        if end_pos > start_pos:
-                            self._deferred_styles.append((start_pos, end_pos, popped))
-                            logger.debug(f"Deferred link style: {popped}, range [{start_pos}, {end_pos})")
-                        break
-                logger.debug(f"Popped link style: {popped}, stack depth: {len(self.active_styles)}")
+
+        i = len(active_styles) - 1
+        if "link" not in active_styles[i]:
+            i = next((j for j in range(i - 1, -1, -1) if "link" in active_styles[j]), -1)
+            if i < 0:
+                logger.warning("No link style found on stack to pop")
                 return
-        logger.warning("No link style found on stack to pop")
+        popped = active_styles.pop(i)
+
+        start_styles = self._style_start_styles
+        j = len(start_styles) - 1
+        if j >= 0 and start_styles[j] is not popped:
+            j = next((k for k in range(j, -1, -1) if "link" in start_styles[k]), -1)
+        if j >= 0:
+            del start_styles[j]
+            self._record_deferred_style(self._style_start_offsets.pop(j), popped)
+        logger.debug("Popped link style: %s, stack depth: %d", popped, len(active_styles))
+
+    def _record_deferred_style(self, start_pos: int, style: dict) -> None:
+        """Record a closed style range ending at the current buffer position, if non-empty."""
+        end_pos = self._text_len
+        if end_pos > start_pos:
+            self._deferred_styles.append((start_pos, end_pos, style))
 
     def _get_merged_style(self) -> dict:
         """Merge all active styles into a single style dict."""
@@ -1203,22 +1279,47 @@ class MarkdownToDocsConverter:
 
     def _get_style_fields(self, style: dict) -> str:
         """Generate the fields mask for updateTextStyle from style keys."""
-        return ",".join(style.keys())
+        return _fields_mask(tuple(style))
+
+    def _merge_deferred_styles(self) -> list[tuple[int, int, dict, str]]:
+        """
+        Merge style ranges with identical start/end into single requests.
 
-    def _merge_deferred_styles(self) -> list[tuple[int, int, dict]]:
-        """Merge style ranges with identical start/end into single requests."""
+        Shared boolean styles (bold/italic/strikethrough) are combined as OR-ed
+        bit flags and materialized from _FLAG_STYLE_TABLE; any other styles on the
+        same range are collected by reference and merged by dict union once, when
+        the output dict is built.
+
+        Returns:
+            (start, end, textStyle, fields) tuples in first-seen range order.
+        """
         if not self._deferred_styles:
             return []
 
-        range_to_style: dict[tuple[int, int], dict] = {}
+        flag_bits = _STYLE_FLAG_BITS
+        range_bits: dict[tuple[int, int], int] = {}
+        range_others: dict[tuple[int, int], list[dict]] = {}
         for start, end, style in self._deferred_styles:
             key = (start, end)
-            if key in range_to_style:
-                range_to_style[key].update(style)
+            bit = flag_bits.get(id(style))
+            if bit is not None:
+                range_bits[key] = range_bits.get(key, 0) | bit
             else:
-                range_to_style[key] = dict(style)
-
-        return [(start, end, style) for (start, end), style in range_to_style.items()]
+                range_bits.setdefault(key, 0)
+                range_others.setdefault(key, []).append(style)
+
+        merged: list[tuple[int, int, dict, str]] = []
+        for key, bits in range_bits.items():
+            flag_style, flag_fields = _FLAG_STYLE_TABLE[bits]
+            others = range_others.get(key)
+            if others is None:
+                merged.append((key[0], key[1], dict(flag_style), flag_fields))
+                continue
+            style = dict(flag_style)
+            for other_style in others:
+                style.update(other_style)
+            merged.append((key[0], key[1], style, self._get_style_fields(style)))
+        return merged
 
     def _build_inline_image_requests(self, start_index: int, raw_bullet_requests: list[dict]) -> list[dict]:
         """
@@ -1350,15 +1451,28 @@ class MarkdownToDocsConverter:
 
             mention_literal = match.group(0)
             email = match.group(1)
-            rel_start = len(self._text_buffer)
+            rel_start = self._text_len
             self._insert_text(mention_literal)
-            rel_end = len(self._text_buffer)
+            rel_end = self._text_len
             self.pending_person_mentions.append((rel_start, rel_end, email))
             cursor = end
 
         if cursor < len(text):
             self._insert_text(text[cursor:])
 
+    def _count_tabs(self, buffer_start: int, buffer_end: int) -> int:
+        """
+        Count TAB characters in _text_buffer[buffer_start:buffer_end].
+
+        TAB positions are indexed once per buffer state (a single C-level scan),
+        so each range count is two bisections instead of a substring copy + scan.
+        """
+        if self._tab_index_len != self._text_len:
+            self._tab_positions = [match.start() for match in _TAB_PATTERN.finditer(self._text_buffer)]
+            self._tab_index_len = self._text_len
+        positions = self._tab_positions
+        return bisect.bisect_left(positions, buffer_end) - bisect.bisect_left(positions, buffer_start)
+
     def _tabs_removed_before_index(self, abs_index: int, start_index: int, raw_bullet_requests: list[dict]) -> int:
         """
         Return the cumulative TAB count removed by createParagraphBullets before abs_index.
@@ -1385,7 +1499,7 @@ class MarkdownToDocsConverter:
 
             buffer_start = max(0, range_start - start_index)
             buffer_end = max(buffer_start, capped_end - start_index)
-            removed_tabs += self._text_buffer[buffer_start:buffer_end].count("\t")
+            removed_tabs += self._count_tabs(buffer_start, buffer_end)
 
         return removed_tabs
 
@@ -1421,8 +1535,7 @@ class MarkdownToDocsConverter:
 
                 buffer_start = original_start - start_index
                 buffer_end = original_end - start_index
-                text_in_range = self._text_buffer[buffer_start:buffer_end]
-                tabs_in_range = text_in_range.count("\t")
+                tabs_in_range = self._count_tabs(buffer_start, buffer_end)
 
                 adjusted_req = {
                     "createParagraphBullets": {
@@ -1437,9 +1550,13 @@ class MarkdownToDocsConverter:
 
                 cumulative_tab_shift += tabs_in_range
                 logger.debug(
-                    f"Adjusted bullet range [{original_start}, {original_end}] -> "
-                    f"[{adjusted_start}, {adjusted_end}] (removed {tabs_in_range} TABs, "
-                    f"cumulative shift: {cumulative_tab_shift})"
+                    "Adjusted bullet range [%d, %d] -> [%d, %d] (removed %d TABs, cumulative shift: %d)",
+                    original_start,
+                    original_end,
+                    adjusted_start,
+                    adjusted_end,
+                    tabs_in_range,
+                    cumulative_tab_shift,
                 )
             elif "deleteParagraphBullets" in req:
                 r = req["deleteParagraphBullets"]["range"]
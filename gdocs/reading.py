@@ -5,9 +5,11 @@ This module provides MCP tools for reading and inspecting Google Docs.
 """
 
 import asyncio
-import io
 import json
 import logging
+import tempfile
+import threading
+import time
 from typing import Any
 
 from googleapiclient.http import MediaIoBaseDownload
@@ -15,7 +17,7 @@ from googleapiclient.http import MediaIoBaseDownload
 from auth.service_decorator import require_google_service, require_multiple_services
 from core.server import server
 from core.types import GoogleDriveService
-from core.utils import extract_office_xml_text, handle_http_errors
+from core.utils import DOWNLOAD_SPOOL_MAX_BYTES, extract_office_xml_text, handle_http_errors
 from gdocs.docs_structure import (
     analyze_document_complexity,
     find_tables,
@@ -26,6 +28,107 @@ from gdrive.drive_helpers import resolve_file_id_or_alias
 
 logger = logging.getLogger(__name__)
 
+# Partial-response mask covering exactly what _extract_doc_text reads. Nested child
+# tabs cannot be masked recursively, so childTabs is returned in full.
+_DOC_TEXT_CONTENT_FIELDS = "content(paragraph(elements(textRun(content))),table(tableRows(tableCells(content))))"
+DOC_TEXT_FIELDS = (
+    f"body({_DOC_TEXT_CONTENT_FIELDS}),"
+    f"tabs(tabProperties(title,tabId),documentTab(body({_DOC_TEXT_CONTENT_FIELDS})),childTabs)"
+)
+
+# Short-lived cache of Drive file metadata (id, name, mimeType, webViewLink) so
+# back-to-back reads of the same file skip the files().get round trip.
+FILE_METADATA_TTL_SECONDS = 60.0
+FILE_METADATA_CACHE_MAX_ENTRIES = 512
+_file_metadata_cache: dict[tuple[str, str], tuple[float, dict]] = {}
+_file_metadata_lock = threading.Lock()
+
+
+def _get_cached_file_metadata(user_google_email: str, file_id: str) -> dict | None:
+    """Return cached Drive metadata for file_id if it is still fresh, else None."""
+    with _file_metadata_lock:
+        cached = _file_metadata_cache.get((user_google_email, file_id))
+    if cached is not None and time.monotonic() - cached[0] < FILE_METADATA_TTL_SECONDS:
+        return cached[1]
+    return None
+
+
+async def _get_file_metadata(drive_service: Any, user_google_email: str, file_id: str) -> dict:
+    """Return Drive metadata for file_id, served from the TTL cache when fresh."""
+    cached_metadata = _get_cached_file_metadata(user_google_email, file_id)
+    if cached_metadata is not None:
+        return cached_metadata
+
+    file_metadata = await asyncio.to_thread(
+        drive_service.files()
+        .get(
+            fileId=file_id,
+            fields="id, name, mimeType, webViewLink",
+            supportsAllDrives=True,
+        )
+        .execute
+    )
+    key = (user_google_email, file_id)
+    with _file_metadata_lock:
+        _file_metadata_cache.pop(key, None)
+        if len(_file_metadata_cache) >= FILE_METADATA_CACHE_MAX_ENTRIES:
+            # Dicts keep insertion order, so the first key is the oldest entry.
+            del _file_metadata_cache[next(iter(_file_metadata_cache))]
+        _file_metadata_cache[key] = (time.monotonic(), file_metadata)
+    return file_metadata
+
+
+def _append_elements_text(elements: list[dict], out: list[str], include_tables: bool = True) -> None:
+    """
+    Append non-blank paragraph lines from document elements to out, in document order.
+
+    Table cells are walked with an explicit stack of element iterators rather than
+    recursion, so nested tables cost no extra Python frames. With include_tables=False
+    table elements are skipped without visiting their cells.
+    """
+    stack = [iter(elements)]
+    while stack:
+        for element in stack[-1]:
+            if "paragraph" in element:
+                line = "".join(
+                    text_run["content"]
+                    for pe in element["paragraph"].get("elements", ())
+                    if (text_run := pe.get("textRun")) and "content" in text_run
+                )
+                if line.strip():
+                    out.append(line)
+            elif include_tables and "table" in element:
+                stack.append(
+                    cell_element
+                    for row in element["table"].get("tableRows", ())
+                    for cell in row.get("tableCells", ())
+                    for cell_element in cell.get("content", ())
+                )
+                break
+        else:
+            stack.pop()
+
+
+def _extract_doc_text(doc_data: dict, include_tables: bool = True) -> str:
+    """Extract plain text from a Docs API document, including all (nested) tabs."""
+    out: list[str] = []
+    _append_elements_text(doc_data.get("body", {}).get("content", []), out, include_tables)
+
+    # Tabs are visited depth-first in document order; nested tabs are indented.
+    pending_tabs = [(tab, 0) for tab in reversed(doc_data.get("tabs", []))]
+    while pending_tabs:
+        tab, level = pending_tabs.pop()
+        if "documentTab" in tab:
+            props = tab.get("tabProperties", {})
+            tab_title = props.get("title", "Untitled Tab")
+            if level > 0:
+                tab_title = "    " * level + f"{tab_title} ( ID: {props.get('tabId', 'Unknown ID')})"
+            out.append(f"\n--- TAB: {tab_title} ---\n")
+            _append_elements_text(tab["documentTab"].get("body", {}).get("content", []), out, include_tables)
+        pending_tabs.extend((child_tab, level + 1) for child_tab in reversed(tab.get("childTabs", [])))
+
+    return "".join(out)
+
 
 @server.tool()
 @handle_http_errors("search_docs", is_read_only=True, service_type="docs")
@@ -51,7 +154,7 @@ async def search_docs(
         .list(
             q=f"name contains '{escaped_query}' and mimeType='application/vnd.google-apps.document' and trashed=false",
             pageSize=page_size,
-            fields="files(id, name, createdTime, modifiedTime, webViewLink)",
+            fields="files(id, name, modifiedTime, webViewLink)",
             supportsAllDrives=True,
             includeItemsFromAllDrives=True,
         )
@@ -62,8 +165,9 @@ async def search_docs(
         return f"No Google Docs found matching '{query}'."
 
     output = [f"Found {len(files)} Google Docs matching '{query}':"]
-    for f in files:
-        output.append(f"- {f['name']} (ID: {f['id']}) Modified: {f.get('modifiedTime')} Link: {f.get('webViewLink')}")
+    output.extend(
+        f"- {f['name']} (ID: {f['id']}) Modified: {f.get('modifiedTime')} Link: {f.get('webViewLink')}" for f in files
+    )
     return "\n".join(output)
 
 
@@ -84,12 +188,17 @@ async def get_doc_content(
     docs_service: Any,
     user_google_email: str,
     document_id: str,
+    include_tables: bool = True,
 ) -> str:
     """
     Retrieves content of a Google Doc or a Drive file (like .docx) identified by document_id.
     - Native Google Docs: Fetches content via Docs API.
     - Office files (.docx, etc.) stored in Drive: Downloads via Drive API and extracts text.
 
+    Args:
+        include_tables: Include table cell text for native Google Docs. Set False to return
+            prose only (use inspect_doc_structure / debug_table_structure for tables).
+
     Returns:
         str: The document content with metadata header.
     """
@@ -98,16 +207,31 @@ async def get_doc_content(
     # Resolve alias (A-Z) to actual file ID if applicable
     document_id = resolve_file_id_or_alias(document_id)
 
-    # Step 2: Get file metadata from Drive
-    file_metadata = await asyncio.to_thread(
-        drive_service.files()
-        .get(
-            fileId=document_id,
-            fields="id, name, mimeType, webViewLink",
-            supportsAllDrives=True,
+    def fetch_doc() -> dict:
+        return (
+            docs_service.documents()
+            .get(documentId=document_id, includeTabsContent=True, fields=DOC_TEXT_FIELDS)
+            .execute()
         )
-        .execute
-    )
+
+    # Step 2: Get file metadata from Drive. Drive and Docs cannot share one batch
+    # request, so on a metadata cache miss the Docs fetch is started alongside the
+    # Drive call; its result (or error) is only used if the file is a native Doc.
+    doc_data: dict | None = None
+    doc_error: BaseException | None = None
+    file_metadata = _get_cached_file_metadata(user_google_email, document_id)
+    if file_metadata is None:
+        file_metadata, doc_result = await asyncio.gather(
+            _get_file_metadata(drive_service, user_google_email, document_id),
+            asyncio.to_thread(fetch_doc),
+            return_exceptions=True,
+        )
+        if isinstance(file_metadata, BaseException):
+            raise file_metadata
+        if isinstance(doc_result, BaseException):
+            doc_error = doc_result
+        else:
+            doc_data = doc_result
     mime_type = file_metadata.get("mimeType", "")
     file_name = file_metadata.get("name", "Unknown File")
     web_view_link = file_metadata.get("webViewLink", "#")
@@ -119,82 +243,12 @@ async def get_doc_content(
     # Step 3: Process based on mimeType
     if mime_type == "application/vnd.google-apps.document":
         logger.info("[get_doc_content] Processing as native Google Doc.")
-        doc_data = await asyncio.to_thread(
-            docs_service.documents().get(documentId=document_id, includeTabsContent=True).execute
-        )
-        # Tab header format constant
-        TAB_HEADER_FORMAT = "\n--- TAB: {tab_name} ---\n"
-
-        def extract_text_from_elements(elements, tab_name=None, depth=0):
-            """Extract text from document elements (paragraphs, tables, etc.)"""
-            # Prevent infinite recursion by limiting depth
-            if depth > 5:
-                return ""
-            text_lines = []
-            if tab_name:
-                text_lines.append(TAB_HEADER_FORMAT.format(tab_name=tab_name))
-
-            for element in elements:
-                if "paragraph" in element:
-                    paragraph = element.get("paragraph", {})
-                    para_elements = paragraph.get("elements", [])
-                    current_line_text = ""
-                    for pe in para_elements:
-                        text_run = pe.get("textRun", {})
-                        if text_run and "content" in text_run:
-                            current_line_text += text_run["content"]
-                    if current_line_text.strip():
-                        text_lines.append(current_line_text)
-                elif "table" in element:
-                    # Handle table content
-                    table = element.get("table", {})
-                    table_rows = table.get("tableRows", [])
-                    for row in table_rows:
-                        row_cells = row.get("tableCells", [])
-                        for cell in row_cells:
-                            cell_content = cell.get("content", [])
-                            cell_text = extract_text_from_elements(cell_content, depth=depth + 1)
-                            if cell_text.strip():
-                                text_lines.append(cell_text)
-            return "".join(text_lines)
-
-        def process_tab_hierarchy(tab, level=0):
-            """Process a tab and its nested child tabs recursively"""
-            tab_text = ""
-
-            if "documentTab" in tab:
-                props = tab.get("tabProperties", {})
-                tab_title = props.get("title", "Untitled Tab")
-                tab_id = props.get("tabId", "Unknown ID")
-                # Add indentation for nested tabs to show hierarchy
-                if level > 0:
-                    tab_title = "    " * level + f"{tab_title} ( ID: {tab_id})"
-                tab_body = tab.get("documentTab", {}).get("body", {}).get("content", [])
-                tab_text += extract_text_from_elements(tab_body, tab_title)
-
-            # Process child tabs (nested tabs)
-            child_tabs = tab.get("childTabs", [])
-            for child_tab in child_tabs:
-                tab_text += process_tab_hierarchy(child_tab, level + 1)
-
-            return tab_text
-
-        processed_text_lines = []
-
-        # Process main document body
-        body_elements = doc_data.get("body", {}).get("content", [])
-        main_content = extract_text_from_elements(body_elements)
-        if main_content.strip():
-            processed_text_lines.append(main_content)
-
-        # Process all tabs
-        tabs = doc_data.get("tabs", [])
-        for tab in tabs:
-            tab_content = process_tab_hierarchy(tab)
-            if tab_content.strip():
-                processed_text_lines.append(tab_content)
-
-        body_text = "".join(processed_text_lines)
+        if doc_error is not None:
+            raise doc_error
+        if doc_data is None:
+            doc_data = await asyncio.to_thread(fetch_doc)
+        # Text extraction is CPU-bound on large docs; keep it off the event loop.
+        body_text = await asyncio.to_thread(_extract_doc_text, doc_data, include_tables)
     else:
         logger.info(f"[get_doc_content] Processing as Drive file (e.g., .docx, other). MimeType: {mime_type}")
 
@@ -215,26 +269,25 @@ async def get_doc_content(
             else drive_service.files().get_media(fileId=document_id, supportsAllDrives=True)
         )
 
-        fh = io.BytesIO()
-        downloader = MediaIoBaseDownload(fh, request_obj)
-        loop = asyncio.get_event_loop()
-        done = False
-        while not done:
-            status, done = await loop.run_in_executor(None, downloader.next_chunk)
-
-        file_content_bytes = fh.getvalue()
-
-        office_text = extract_office_xml_text(file_content_bytes, mime_type)
-        if office_text:
-            body_text = office_text
-        else:
-            try:
-                body_text = file_content_bytes.decode("utf-8")
-            except UnicodeDecodeError:
-                body_text = (
-                    f"[Binary or unsupported text encoding for mimeType '{mime_type}' - "
-                    f"{len(file_content_bytes)} bytes]"
-                )
+        # Spool the download so large files spill to disk instead of being held
+        # in memory and then copied again by getvalue().
+        with tempfile.SpooledTemporaryFile(max_size=DOWNLOAD_SPOOL_MAX_BYTES) as fh:
+            downloader = MediaIoBaseDownload(fh, request_obj)
+            done = False
+            while not done:
+                status, done = await asyncio.to_thread(downloader.next_chunk)
+
+            file_size = fh.tell()
+            fh.seek(0)
+            office_text = extract_office_xml_text(fh, mime_type)
+            if office_text:
+                body_text = office_text
+            else:
+                fh.seek(0)
+                try:
+                    body_text = fh.read().decode("utf-8")
+                except UnicodeDecodeError:
+                    body_text = f"[Binary or unsupported text encoding for mimeType '{mime_type}' - {file_size} bytes]"
 
     header = f'File: "{file_name}" (ID: {document_id}, Type: {mime_type})\nLink: {web_view_link}\n\n--- CONTENT ---\n'
     return header + body_text
@@ -269,8 +322,9 @@ async def list_docs_in_folder(
     if not items:
         return f"No Google Docs found in folder '{folder_id}'."
     out = [f"Found {len(items)} Docs in folder '{folder_id}':"]
-    for f in items:
-        out.append(f"- {f['name']} (ID: {f['id']}) Modified: {f.get('modifiedTime')} Link: {f.get('webViewLink')}")
+    out.extend(
+        f"- {f['name']} (ID: {f['id']}) Modified: {f.get('modifiedTime')} Link: {f.get('webViewLink')}" for f in items
+    )
     return "\n".join(out)
 
 
@@ -397,5 +451,7 @@ async def inspect_doc_structure(
                     }
                 )
 
+    # Compact separators: the consumer is an LLM, and indentation only adds tokens.
+    result_json = json.dumps(result, separators=(",", ":"))
     link = f"https://docs.google.com/document/d/{document_id}/edit"
-    return f"Document structure analysis for {document_id}:\n\n{json.dumps(result, indent=2)}\n\nLink: {link}"
+    return f"Document structure analysis for {document_id}:\n\n{result_json}\n\nLink: {link}"
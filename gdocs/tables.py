@@ -18,6 +18,8 @@ from gdrive.drive_helpers import resolve_file_id_or_alias
 
 logger = logging.getLogger(__name__)
 
+_VALIDATOR = ValidationManager()
+
 
 @server.tool()
 @handle_http_errors("create_table_with_data", service_type="docs")
@@ -27,14 +29,17 @@ async def create_table_with_data(
     user_google_email: str,
     document_id: str,
     table_data: list[list[str]],
-    index: int,
+    index: int | None = None,
     bold_headers: bool = True,
+    auto_append: bool = False,
     dry_run: bool = True,
 ) -> str:
     """
     Creates a table and populates it with data in one reliable operation.
 
     CRITICAL: YOU MUST CALL inspect_doc_structure FIRST TO GET THE INDEX!
+    (Exception: to append the table at the end of the document, pass auto_append=True
+    and omit index; it is looked up for you.)
 
     MANDATORY WORKFLOW - DO THESE STEPS IN ORDER:
 
@@ -66,8 +71,9 @@ async def create_table_with_data(
         user_google_email: User's Google email address
         document_id: ID of the document to update
         table_data: 2D list of strings - EXACT format: [["col1", "col2"], ["row1col1", "row1col2"]]
-        index: Document position (MANDATORY: get from inspect_doc_structure 'total_length')
+        index: Document position (MANDATORY unless auto_append: get from inspect_doc_structure 'total_length')
         bold_headers: Whether to make first row bold (default: true)
+        auto_append: Append at the end of the document; index is not needed and is ignored (default: false)
         dry_run: When True (default), return planned mutation without executing it
 
     Returns:
@@ -78,7 +84,7 @@ async def create_table_with_data(
     # Resolve alias (A-Z) to actual file ID if applicable
     document_id = resolve_file_id_or_alias(document_id)
 
-    validator = ValidationManager()
+    validator = _VALIDATOR
 
     is_valid, error_msg = validator.validate_document_id(document_id)
     if not is_valid:
@@ -88,20 +94,34 @@ async def create_table_with_data(
     if not is_valid:
         return f"ERROR: {error_msg}"
 
-    is_valid, error_msg = validator.validate_index(index, "Index")
-    if not is_valid:
-        return f"ERROR: {error_msg}"
+    if not auto_append:
+        if index is None:
+            return "ERROR: index is required unless auto_append is True"
+        is_valid, error_msg = validator.validate_index(index, "Index")
+        if not is_valid:
+            return f"ERROR: {error_msg}"
 
     rows = len(table_data)
     columns = len(table_data[0]) if table_data else 0
     link = f"https://docs.google.com/document/d/{document_id}/edit"
 
     if dry_run:
+        planned_index = "end of document" if auto_append else index
         return (
             f"DRY RUN: Would create and populate table in document {document_id} for {user_google_email}. "
-            f"Table: {rows}x{columns}, Index: {index}, bold_headers={bold_headers}. Link: {link}"
+            f"Table: {rows}x{columns}, Index: {planned_index}, bold_headers={bold_headers}. Link: {link}"
         )
 
+    # index is only None here when auto_append is set
+    if auto_append or index is None:
+        # Only the body end index is needed, so fetch just that instead of the whole document.
+        doc = await asyncio.to_thread(
+            service.documents().get(documentId=document_id, fields="body(content(endIndex))").execute
+        )
+        content = doc.get("body", {}).get("content", [])
+        index = max(int(content[-1].get("endIndex", 2)) - 1, 1) if content else 1
+        logger.debug(f"auto_append: resolved end-of-document index {index}")
+
     table_manager = TableOperationManager(service)
 
     success, message, metadata = await table_manager.create_and_populate_table(
@@ -174,7 +194,10 @@ async def debug_table_structure(
     # Resolve alias (A-Z) to actual file ID if applicable
     document_id = resolve_file_id_or_alias(document_id)
 
-    doc = await asyncio.to_thread(service.documents().get(documentId=document_id).execute)
+    # find_tables only reads table elements and their positions.
+    doc = await asyncio.to_thread(
+        service.documents().get(documentId=document_id, fields="body(content(startIndex,endIndex,table))").execute
+    )
 
     tables = find_tables(doc)
     if table_index >= len(tables):
@@ -186,21 +209,21 @@ async def debug_table_structure(
         "table_index": table_index,
         "dimensions": f"{table_info['rows']}x{table_info['columns']}",
         "table_range": f"[{table_info['start_index']}-{table_info['end_index']}]",
-        "cells": [],
+        "cells": [
+            [
+                {
+                    "position": f"({row_idx},{col_idx})",
+                    "range": f"[{cell['start_index']}-{cell['end_index']}]",
+                    "insertion_index": cell.get("insertion_index", "N/A"),
+                    "current_content": repr(cell.get("content", "")),
+                    "content_elements_count": len(cell.get("content_elements", ())),
+                }
+                for col_idx, cell in enumerate(row)
+            ]
+            for row_idx, row in enumerate(table_info["cells"])
+        ],
     }
 
-    for row_idx, row in enumerate(table_info["cells"]):
-        row_info = []
-        for col_idx, cell in enumerate(row):
-            cell_debug = {
-                "position": f"({row_idx},{col_idx})",
-                "range": f"[{cell['start_index']}-{cell['end_index']}]",
-                "insertion_index": cell.get("insertion_index", "N/A"),
-                "current_content": repr(cell.get("content", "")),
-                "content_elements_count": len(cell.get("content_elements", [])),
-            }
-            row_info.append(cell_debug)
-        debug_info["cells"].append(row_info)
-
+    debug_info_json = json.dumps(debug_info, separators=(",", ":"))
     link = f"https://docs.google.com/document/d/{document_id}/edit"
-    return f"Table structure debug for table {table_index}:\n\n{json.dumps(debug_info, indent=2)}\n\nLink: {link}"
+    return f"Table structure debug for table {table_index}:\n\n{debug_info_json}\n\nLink: {link}"
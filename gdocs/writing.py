@@ -27,6 +27,9 @@ from gdrive.drive_helpers import resolve_file_id_or_alias
 
 logger = logging.getLogger(__name__)
 
+# ValidationManager is stateless, so one instance serves every tool call.
+_VALIDATOR = ValidationManager()
+
 
 def _validate_markdown_modes(checklist_mode: str, mention_mode: str) -> str | None:
     """Validate markdown conversion mode inputs."""
@@ -189,9 +192,15 @@ async def create_doc(
         create_doc(title="Plain Doc", content="# This is literal text", parse_markdown=False)
     """
     logger.info(
-        f"[create_doc] Invoked. Email: '{user_google_email}', Title='{title}', "
-        f"parse_markdown={parse_markdown}, checklist_mode={checklist_mode}, mention_mode={mention_mode}, "
-        f"dry_run={dry_run}, content_len={len(content)}"
+        "[create_doc] Invoked. Email: '%s', Title='%s', parse_markdown=%s, checklist_mode=%s, mention_mode=%s, "
+        "dry_run=%s, content_len=%d",
+        user_google_email,
+        title,
+        parse_markdown,
+        checklist_mode,
+        mention_mode,
+        dry_run,
+        len(content),
     )
 
     mode_error = _validate_markdown_modes(checklist_mode, mention_mode)
@@ -224,7 +233,7 @@ async def create_doc(
         if parse_markdown:
             converter = MarkdownToDocsConverter(checklist_mode=checklist_mode, mention_mode=mention_mode)
             requests = converter.convert(content, start_index=1)
-            logger.debug(f"[create_doc] Markdown converter generated {len(requests)} request(s)")
+            logger.debug("[create_doc] Markdown converter generated %d request(s)", len(requests))
             base_requests, mention_phase_requests, image_phase_requests, table_phase_requests = (
                 _partition_markdown_requests(requests)
             )
@@ -302,7 +311,6 @@ async def create_doc(
     msg = f"Created Google Doc '{title}' (ID: {doc_id}) {mode_info}. Link: {link}".strip()
     if content and parse_markdown and fallback_mentions:
         msg += " Mention fallback kept literal tokens for: " + ", ".join(fallback_mentions)
-    logger.info(f"Successfully created Google Doc '{title}' (ID: {doc_id}) for {user_google_email}. Link: {link}")
     return msg
 
 
@@ -346,44 +354,37 @@ async def modify_doc_text(
     Returns:
         str: Confirmation message with operation details
     """
+    has_formatting = bool(
+        bold is not None
+        or italic is not None
+        or underline is not None
+        or font_size
+        or font_family
+        or text_color
+        or background_color
+    )
     logger.info(
-        f"[modify_doc_text] Doc={document_id}, start={start_index}, end={end_index}, text={text is not None}, "
-        f"formatting={any([bold, italic, underline, font_size, font_family, text_color, background_color])}"
+        "[modify_doc_text] Doc=%s, start=%s, end=%s, text=%s, formatting=%s",
+        document_id,
+        start_index,
+        end_index,
+        text is not None,
+        has_formatting,
     )
 
     # Resolve alias (A-Z) to actual file ID if applicable
     document_id = resolve_file_id_or_alias(document_id)
 
-    validator = ValidationManager()
+    validator = _VALIDATOR
 
     is_valid, error_msg = validator.validate_document_id(document_id)
     if not is_valid:
         return f"Error: {error_msg}"
 
-    if text is None and not any(
-        [
-            bold is not None,
-            italic is not None,
-            underline is not None,
-            font_size,
-            font_family,
-            text_color,
-            background_color,
-        ]
-    ):
+    if text is None and not has_formatting:
         return "Error: Must provide either 'text' to insert/replace, or formatting parameters (bold, italic, underline, font_size, font_family, text_color, background_color)."
 
-    if any(
-        [
-            bold is not None,
-            italic is not None,
-            underline is not None,
-            font_size,
-            font_family,
-            text_color,
-            background_color,
-        ]
-    ):
+    if has_formatting:
         is_valid, error_msg = validator.validate_text_formatting_params(
             bold,
             italic,
@@ -406,50 +407,24 @@ async def modify_doc_text(
     requests = []
     operations = []
 
-    if text is not None:
-        if end_index is not None and end_index > start_index:
-            if start_index == 0:
-                requests.append(create_insert_text_request(1, text))
-                adjusted_end = end_index + len(text)
-                requests.append(create_delete_range_request(1 + len(text), adjusted_end))
-                operations.append(f"Replaced text from index {start_index} to {end_index}")
-            else:
-                requests.extend(
-                    [
-                        create_delete_range_request(start_index, end_index),
-                        create_insert_text_request(start_index, text),
-                    ]
-                )
-                operations.append(f"Replaced text from index {start_index} to {end_index}")
-        else:
-            actual_index = 1 if start_index == 0 else start_index
-            requests.append(create_insert_text_request(actual_index, text))
-            operations.append(f"Inserted text at index {start_index}")
+    # Index 0 is the document's section break; text always lands at index 1 or later.
+    insert_index = 1 if start_index == 0 else start_index
 
-    if any(
-        [
-            bold is not None,
-            italic is not None,
-            underline is not None,
-            font_size,
-            font_family,
-            text_color,
-            background_color,
-        ]
-    ):
-        format_start = start_index
-        format_end = end_index
-
-        if text is not None:
-            if end_index is not None and end_index > start_index:
-                format_end = start_index + len(text)
-            else:
-                actual_index = 1 if start_index == 0 else start_index
-                format_start = actual_index
-                format_end = actual_index + len(text)
-
-        if format_start == 0:
-            format_start = 1
+    if text is not None and end_index is not None and end_index > start_index:
+        if start_index == 0:
+            requests.append(create_insert_text_request(1, text))
+            requests.append(create_delete_range_request(1 + len(text), end_index + len(text)))
+        else:
+            requests.append(create_delete_range_request(start_index, end_index))
+            requests.append(create_insert_text_request(start_index, text))
+        operations.append(f"Replaced text from index {start_index} to {end_index}")
+    elif text is not None:
+        requests.append(create_insert_text_request(insert_index, text))
+        operations.append(f"Inserted text at index {start_index}")
+
+    if has_formatting:
+        format_start = insert_index
+        format_end = end_index if text is None else insert_index + len(text)
         if format_end is None or format_end <= format_start:
             format_end = format_start + 1
 
@@ -467,23 +442,21 @@ async def modify_doc_text(
         if format_request:
             requests.append(format_request)
 
-        format_details = []
-        if bold is not None:
-            format_details.append(f"bold={bold}")
-        if italic is not None:
-            format_details.append(f"italic={italic}")
-        if underline is not None:
-            format_details.append(f"underline={underline}")
-        if font_size:
-            format_details.append(f"font_size={font_size}")
-        if font_family:
-            format_details.append(f"font_family={font_family}")
-        if text_color:
-            format_details.append(f"text_color={text_color}")
-        if background_color:
-            format_details.append(f"background_color={background_color}")
-
-        operations.append(f"Applied formatting ({', '.join(format_details)}) to range {format_start}-{format_end}")
+        format_details = ", ".join(
+            f"{name}={value}"
+            for name, value, is_set in (
+                ("bold", bold, bold is not None),
+                ("italic", italic, italic is not None),
+                ("underline", underline, underline is not None),
+                ("font_size", font_size, font_size),
+                ("font_family", font_family, font_family),
+                ("text_color", text_color, text_color),
+                ("background_color", background_color, background_color),
+            )
+            if is_set
+        )
+
+        operations.append(f"Applied formatting ({format_details}) to range {format_start}-{format_end}")
 
     operation_summary = "; ".join(operations)
     link = f"https://docs.google.com/document/d/{document_id}/edit"
@@ -528,7 +501,7 @@ async def find_and_replace_doc(
     Returns:
         str: Confirmation message with replacement count
     """
-    logger.info(f"[find_and_replace_doc] Doc={document_id}, find='{find_text}', replace='{replace_text}'")
+    logger.info("[find_and_replace_doc] Doc=%s, find='%s', replace='%s'", document_id, find_text, replace_text)
 
     # Resolve alias (A-Z) to actual file ID if applicable
     document_id = resolve_file_id_or_alias(document_id)
@@ -581,12 +554,12 @@ async def update_doc_headers_footers(
     Returns:
         str: Confirmation message with update details
     """
-    logger.info(f"[update_doc_headers_footers] Doc={document_id}, type={section_type}")
+    logger.info("[update_doc_headers_footers] Doc=%s, type=%s", document_id, section_type)
 
     # Resolve alias (A-Z) to actual file ID if applicable
     document_id = resolve_file_id_or_alias(document_id)
 
-    validator = ValidationManager()
+    validator = _VALIDATOR
 
     is_valid, error_msg = validator.validate_document_id(document_id)
     if not is_valid:
@@ -626,7 +599,8 @@ async def batch_update_doc(
     service: Any,
     user_google_email: str,
     document_id: str,
-    operations: list[dict[str, Any]],
+    operations: list[dict[str, Any]] | None = None,
+    raw_requests: list[dict[str, Any]] | None = None,
     dry_run: bool = True,
 ) -> str:
     """
@@ -637,8 +611,12 @@ async def batch_update_doc(
         document_id: ID of the document to update
         operations: List of operation dictionaries. Each operation should contain:
                    - type: Operation type ('insert_text', 'delete_text', 'replace_text',
-                     'format_text', 'insert_table', 'insert_page_break', 'insert_markdown')
+                     'format_text', 'insert_table', 'insert_page_break', 'find_replace',
+                     'insert_markdown')
                    - Additional parameters specific to each operation type
+        raw_requests: Native Google Docs API batchUpdate requests (e.g. {"insertText": {...}}),
+                      sent as-is instead of translating `operations`. Provide exactly one of
+                      `operations` or `raw_requests`.
         dry_run: When True (default), return planned batch summary without executing it
 
     Example operations:
@@ -646,23 +624,56 @@ async def batch_update_doc(
             {"type": "insert_text", "index": 1, "text": "Hello World"},
             {"type": "format_text", "start_index": 1, "end_index": 12, "bold": true},
             {"type": "insert_table", "index": 20, "rows": 2, "columns": 3},
+            {"type": "find_replace", "find_text": "{{name}}", "replace_text": "Ada"},
             {"type": "insert_markdown", "markdown_text": "# Heading\\n\\n**Bold** text", "index": 1}
         ]
 
     Returns:
         str: Confirmation message with batch operation results
     """
-    logger.debug(f"[batch_update_doc] Doc={document_id}, operations={len(operations)}")
+    logger.debug(
+        "[batch_update_doc] Doc=%s, operations=%s, raw_requests=%s",
+        document_id,
+        len(operations) if operations is not None else None,
+        len(raw_requests) if raw_requests is not None else None,
+    )
 
     # Resolve alias (A-Z) to actual file ID if applicable
     document_id = resolve_file_id_or_alias(document_id)
 
-    validator = ValidationManager()
+    validator = _VALIDATOR
 
     is_valid, error_msg = validator.validate_document_id(document_id)
     if not is_valid:
         return f"Error: {error_msg}"
 
+    if raw_requests is not None:
+        if operations is not None:
+            return "Error: Provide exactly one of 'operations' or 'raw_requests'."
+
+        is_valid, error_msg = validator.validate_raw_requests(raw_requests)
+        if not is_valid:
+            return f"Error: {error_msg}"
+
+        if dry_run:
+            return (
+                f"DRY RUN: Would send {len(raw_requests)} raw request(s) to document {document_id} "
+                f"for {user_google_email}."
+            )
+
+        result = await asyncio.to_thread(
+            service.documents().batchUpdate(documentId=document_id, body={"requests": raw_requests}).execute
+        )
+        link = f"https://docs.google.com/document/d/{document_id}/edit"
+        replies_count = len(result.get("replies", []))
+        return (
+            f"Successfully executed {len(raw_requests)} raw request(s) on document {document_id}. "
+            f"API replies: {replies_count}. Link: {link}"
+        )
+
+    if operations is None:
+        return "Error: Provide exactly one of 'operations' or 'raw_requests'."
+
     is_valid, error_msg = validator.validate_batch_operations(operations)
     if not is_valid:
         return f"Error: {error_msg}"
@@ -680,7 +691,11 @@ async def batch_update_doc(
     if success:
         link = f"https://docs.google.com/document/d/{document_id}/edit"
         replies_count = metadata.get("replies_count", 0)
-        return f"{message} on document {document_id}. API replies: {replies_count}. Link: {link}"
+        replacements = metadata.get("replacements")
+        replacement_info = (
+            f" Occurrences replaced per find_replace: {', '.join(map(str, replacements))}." if replacements else ""
+        )
+        return f"{message} on document {document_id}. API replies: {replies_count}.{replacement_info} Link: {link}"
     else:
         return f"Error: {message}"
 
@@ -726,14 +741,18 @@ async def insert_markdown(
         )
     """
     logger.info(
-        f"[insert_markdown] Doc={document_id}, markdown_len={len(markdown_text)}, start_index={index}, "
-        f"checklist_mode={checklist_mode}, mention_mode={mention_mode}"
+        "[insert_markdown] Doc=%s, markdown_len=%d, start_index=%s, checklist_mode=%s, mention_mode=%s",
+        document_id,
+        len(markdown_text),
+        index,
+        checklist_mode,
+        mention_mode,
     )
 
     # Resolve alias (A-Z) to actual file ID if applicable
     document_id = resolve_file_id_or_alias(document_id)
 
-    validator = ValidationManager()
+    validator = _VALIDATOR
 
     is_valid, error_msg = validator.validate_document_id(document_id)
     if not is_valid:
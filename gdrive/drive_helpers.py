@@ -6,6 +6,8 @@ Shared utilities for Google Drive operations including permission checking.
 
 import asyncio
 import re
+import threading
+import time
 from typing import Any
 
 from core.errors import APIError, ValidationError
@@ -223,6 +225,21 @@ SHORTCUT_MIME_TYPE = "application/vnd.google-apps.shortcut"
 FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
 BASE_SHORTCUT_FIELDS = "id, mimeType, parents, shortcutDetails(targetId, targetMimeType)"
 
+# Recent resolve_drive_item results, per (user, requested ID, extra_fields), for callers
+# that opt in with cache_user; only used for display metadata such as name and owners.
+DRIVE_ITEM_CACHE_TTL_SECONDS = 60.0
+DRIVE_ITEM_CACHE_MAX_ENTRIES = 1024
+_drive_item_cache: dict[tuple[str, str, str | None], tuple[float, str, dict[str, Any]]] = {}
+_drive_item_cache_lock = threading.Lock()
+
+
+def forget_drive_item(file_id: str) -> None:
+    """Drop cached resolve_drive_item results for a file after it has been modified."""
+    with _drive_item_cache_lock:
+        stale = [key for key, (_, resolved_id, _) in _drive_item_cache.items() if file_id in (key[1], resolved_id)]
+        for key in stale:
+            del _drive_item_cache[key]
+
 
 async def resolve_drive_item(
     service,
@@ -230,13 +247,34 @@ async def resolve_drive_item(
     *,
     extra_fields: str | None = None,
     max_depth: int = 5,
+    cache_user: str | None = None,
 ) -> tuple[str, dict[str, Any]]:
     """
     Resolve a Drive shortcut so downstream callers operate on the real item.
 
     Returns the resolved file ID and its metadata. Raises if shortcut targets loop
     or exceed max_depth to avoid infinite recursion.
+
+    When cache_user is given, the result is cached for that user for
+    DRIVE_ITEM_CACHE_TTL_SECONDS and served from the cache on repeat calls.
     """
+    if cache_user is not None:
+        cache_key = (cache_user, file_id, extra_fields)
+        with _drive_item_cache_lock:
+            cached = _drive_item_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < DRIVE_ITEM_CACHE_TTL_SECONDS:
+            return cached[1], dict(cached[2])
+
+        resolved_id, metadata = await resolve_drive_item(
+            service, file_id, extra_fields=extra_fields, max_depth=max_depth
+        )
+        with _drive_item_cache_lock:
+            _drive_item_cache.pop(cache_key, None)
+            if len(_drive_item_cache) >= DRIVE_ITEM_CACHE_MAX_ENTRIES:
+                del _drive_item_cache[next(iter(_drive_item_cache))]
+            _drive_item_cache[cache_key] = (time.monotonic(), resolved_id, dict(metadata))
+        return resolved_id, metadata
+
     current_id = file_id
     depth = 0
     fields = BASE_SHORTCUT_FIELDS
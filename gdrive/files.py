@@ -8,8 +8,10 @@ import asyncio
 import base64
 import io
 import logging
+import os
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from pathlib import Path
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, SpooledTemporaryFile
 from urllib.parse import urlparse
 from urllib.request import url2pathname
 
@@ -21,16 +23,121 @@ from auth.service_decorator import require_google_service
 from core.attachment_storage import get_attachment_storage, get_attachment_url
 from core.errors import ValidationError
 from core.server import server
-from core.utils import extract_office_xml_text, handle_http_errors
+from core.utils import DOWNLOAD_SPOOL_MAX_BYTES, extract_office_xml_text, handle_http_errors
 from gdrive.drive_helpers import (
+    forget_drive_item,
     resolve_drive_item,
     resolve_folder_id,
 )
 
 logger = logging.getLogger(__name__)
 
-DOWNLOAD_CHUNK_SIZE_BYTES = 256 * 1024  # 256 KB
+# Chunk size for streaming fileUrl downloads; each chunk costs one to_thread write hop
+DOWNLOAD_CHUNK_SIZE_BYTES = int(os.getenv("WORKSPACE_MCP_DRIVE_DOWNLOAD_CHUNK_KB", "1024")) * 1024  # 1 MB
 UPLOAD_CHUNK_SIZE_BYTES = 5 * 1024 * 1024  # 5 MB (Google recommended minimum)
+_STATELESS_PREVIEW_BYTES = 100
+_ZIP_MIN_BYTES = 22  # end-of-central-directory record; anything shorter cannot be an Office file
+
+# Google-native MIME type -> plain-text export used by get_drive_file_content
+_TEXT_EXPORT_MIME_TYPES = {
+    "application/vnd.google-apps.document": "text/plain",
+    "application/vnd.google-apps.spreadsheet": "text/csv",
+    "application/vnd.google-apps.presentation": "text/plain",
+}
+
+_OFFICE_MIME_TYPES = frozenset(
+    {
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    }
+)
+
+# Google-native MIME type -> {export_format: (export MIME type, file extension)};
+# the None entry is the default when export_format is missing or not listed.
+_DOWNLOAD_EXPORT_FORMATS: dict[str, dict[str | None, tuple[str, str]]] = {
+    "application/vnd.google-apps.document": {
+        None: ("application/pdf", ".pdf"),
+        "docx": ("application/vnd.openxmlformats-officedocument.wordprocessingml.document", ".docx"),
+    },
+    "application/vnd.google-apps.spreadsheet": {
+        None: ("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", ".xlsx"),
+        "csv": ("text/csv", ".csv"),
+    },
+    "application/vnd.google-apps.presentation": {
+        None: ("application/pdf", ".pdf"),
+        "pptx": ("application/vnd.openxmlformats-officedocument.presentationml.presentation", ".pptx"),
+    },
+}
+
+# Boolean file field -> (change line when set to True, change line when set to False) for update_drive_file
+_FLAG_CHANGE_MESSAGES = (
+    ("starred", "File starred", "File unstarred"),
+    ("trashed", "File moved to trash", "File restored from trash"),
+    ("writersCanShare", "Writers can share the file", "Writers cannot share the file"),
+    ("copyRequiresWriterPermission", "Copying requires writer permission", "Copying doesn't require writer permission"),
+)
+
+
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+async def _get_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared client for fileUrl fetches, so repeat origins reuse pooled connections.
+
+    Pooled connections belong to the event loop that opened them, so a new
+    client is created if the running loop has changed, and the one it replaces
+    is closed. The last client is released with the process. Fetches for every
+    user share the client, so its cookie jar refuses all cookies rather than
+    carrying one user's cookies into another's request.
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is not None and not _http_client.is_closed and _http_client_loop is loop:
+        return _http_client
+
+    replaced = _http_client
+    _http_client = httpx.AsyncClient(
+        follow_redirects=True,
+        cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+    )
+    _http_client_loop = loop
+    if replaced is not None and not replaced.is_closed:
+        await replaced.aclose()
+    return _http_client
+
+
+def _retarget_extension(name: str, extension: str) -> str:
+    """Return name with the given extension, keeping it as-is if it already has it (case-insensitive)."""
+    path = Path(name)
+    if path.suffix.lower() == extension:
+        return name
+    return f"{path.stem}{extension}"
+
+
+def _drain_download(downloader: MediaIoBaseDownload) -> None:
+    """Run a media download to completion; blocking, so call it once via asyncio.to_thread."""
+    done = False
+    while not done:
+        _, done = downloader.next_chunk()
+
+
+def _download_to_text(fh: io.BytesIO, mime_type: str) -> str:
+    """Convert downloaded file content to text: Office XML extraction, then UTF-8, then a binary note."""
+    if mime_type in _OFFICE_MIME_TYPES and fh.getbuffer().nbytes >= _ZIP_MIN_BYTES:
+        fh.seek(0)
+        office_text = extract_office_xml_text(fh, mime_type)
+        if office_text:
+            return office_text
+
+    # A view over the download buffer; avoids copying the whole file into a new bytes object
+    file_content = fh.getbuffer()
+    try:
+        return str(file_content, "utf-8")
+    except UnicodeDecodeError:
+        return f"[Binary or unsupported text encoding for mimeType '{mime_type}' - {len(file_content)} bytes]"
 
 
 @server.tool()
@@ -66,11 +173,7 @@ async def get_drive_file_content(
     file_id = resolved_file_id
     mime_type = file_metadata.get("mimeType", "")
     file_name = file_metadata.get("name", "Unknown File")
-    export_mime_type = {
-        "application/vnd.google-apps.document": "text/plain",
-        "application/vnd.google-apps.spreadsheet": "text/csv",
-        "application/vnd.google-apps.presentation": "text/plain",
-    }.get(mime_type)
+    export_mime_type = _TEXT_EXPORT_MIME_TYPES.get(mime_type)
 
     request_obj = (
         service.files().export_media(fileId=file_id, mimeType=export_mime_type)
@@ -78,39 +181,9 @@ async def get_drive_file_content(
         else service.files().get_media(fileId=file_id)
     )
     fh = io.BytesIO()
-    downloader = MediaIoBaseDownload(fh, request_obj)
-    loop = asyncio.get_event_loop()
-    done = False
-    while not done:
-        status, done = await loop.run_in_executor(None, downloader.next_chunk)
-
-    file_content_bytes = fh.getvalue()
+    await asyncio.to_thread(_drain_download, MediaIoBaseDownload(fh, request_obj))
 
-    office_mime_types = {
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        "application/vnd.openxmlformats-officedocument.presentationml.presentation",
-        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-    }
-
-    if mime_type in office_mime_types:
-        office_text = extract_office_xml_text(file_content_bytes, mime_type)
-        if office_text:
-            body_text = office_text
-        else:
-            try:
-                body_text = file_content_bytes.decode("utf-8")
-            except UnicodeDecodeError:
-                body_text = (
-                    f"[Binary or unsupported text encoding for mimeType '{mime_type}' - "
-                    f"{len(file_content_bytes)} bytes]"
-                )
-    else:
-        try:
-            body_text = file_content_bytes.decode("utf-8")
-        except UnicodeDecodeError:
-            body_text = (
-                f"[Binary or unsupported text encoding for mimeType '{mime_type}' - {len(file_content_bytes)} bytes]"
-            )
+    body_text = _download_to_text(fh, mime_type)
 
     header = (
         f'File: "{file_name}" (ID: {file_id}, Type: {mime_type})\n'
@@ -163,41 +236,11 @@ async def get_drive_file_download_url(
     output_filename = file_name
     output_mime_type = mime_type
 
-    if mime_type == "application/vnd.google-apps.document":
-        if export_format == "docx":
-            export_mime_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-            output_mime_type = export_mime_type
-            if not output_filename.endswith(".docx"):
-                output_filename = f"{Path(output_filename).stem}.docx"
-        else:
-            export_mime_type = "application/pdf"
-            output_mime_type = export_mime_type
-            if not output_filename.endswith(".pdf"):
-                output_filename = f"{Path(output_filename).stem}.pdf"
-
-    elif mime_type == "application/vnd.google-apps.spreadsheet":
-        if export_format == "csv":
-            export_mime_type = "text/csv"
-            output_mime_type = export_mime_type
-            if not output_filename.endswith(".csv"):
-                output_filename = f"{Path(output_filename).stem}.csv"
-        else:
-            export_mime_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-            output_mime_type = export_mime_type
-            if not output_filename.endswith(".xlsx"):
-                output_filename = f"{Path(output_filename).stem}.xlsx"
-
-    elif mime_type == "application/vnd.google-apps.presentation":
-        if export_format == "pptx":
-            export_mime_type = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
-            output_mime_type = export_mime_type
-            if not output_filename.endswith(".pptx"):
-                output_filename = f"{Path(output_filename).stem}.pptx"
-        else:
-            export_mime_type = "application/pdf"
-            output_mime_type = export_mime_type
-            if not output_filename.endswith(".pdf"):
-                output_filename = f"{Path(output_filename).stem}.pdf"
+    export_formats = _DOWNLOAD_EXPORT_FORMATS.get(mime_type)
+    if export_formats:
+        export_mime_type, extension = export_formats.get(export_format, export_formats[None])
+        output_mime_type = export_mime_type
+        output_filename = _retarget_extension(output_filename, extension)
 
     request_obj = (
         service.files().export_media(fileId=file_id, mimeType=export_mime_type)
@@ -205,18 +248,14 @@ async def get_drive_file_download_url(
         else service.files().get_media(fileId=file_id)
     )
 
-    fh = io.BytesIO()
-    downloader = MediaIoBaseDownload(fh, request_obj)
-    loop = asyncio.get_event_loop()
-    done = False
-    while not done:
-        status, done = await loop.run_in_executor(None, downloader.next_chunk)
-
-    file_content_bytes = fh.getvalue()
-    size_bytes = len(file_content_bytes)
-    size_kb = size_bytes / 1024 if size_bytes else 0
-
     if is_stateless_mode():
+        # Only a preview is returned, so fetch just its byte range; Content-Range still reports the full size
+        fh = io.BytesIO()
+        status, _ = await asyncio.to_thread(
+            MediaIoBaseDownload(fh, request_obj, chunksize=_STATELESS_PREVIEW_BYTES).next_chunk
+        )
+        size_bytes = status.total_size if status.total_size is not None else fh.tell()
+        size_kb = size_bytes / 1024 if size_bytes else 0
         result_lines = [
             "File downloaded successfully!",
             f"File: {file_name}",
@@ -225,47 +264,54 @@ async def get_drive_file_download_url(
             f"MIME Type: {output_mime_type}",
             "\nStateless mode: File storage disabled.",
             "\nBase64-encoded content (first 100 characters shown):",
-            f"{base64.b64encode(file_content_bytes[:100]).decode('utf-8')}...",
+            f"{base64.b64encode(fh.getbuffer()[:_STATELESS_PREVIEW_BYTES]).decode('ascii')}...",
         ]
         logger.info(f"[get_drive_file_download_url] Successfully downloaded {size_kb:.1f} KB file (stateless mode)")
         return "\n".join(result_lines)
 
-    try:
-        storage = get_attachment_storage()
-        base64_data = base64.urlsafe_b64encode(file_content_bytes).decode("utf-8")
-
-        saved_file_id = storage.save_attachment(
-            base64_data=base64_data,
-            filename=output_filename,
-            mime_type=output_mime_type,
-        )
-
-        download_url = get_attachment_url(saved_file_id)
-
-        result_lines = [
-            "File downloaded successfully!",
-            f"File: {file_name}",
-            f"File ID: {file_id}",
-            f"Size: {size_kb:.1f} KB ({size_bytes} bytes)",
-            f"MIME Type: {output_mime_type}",
-            f"\nDownload URL: {download_url}",
-            "\nThe file has been saved and is available at the URL above.",
-            "The file will expire after 1 hour.",
-        ]
+    # Spool to disk past DOWNLOAD_SPOOL_MAX_BYTES so large files are not held in memory
+    with SpooledTemporaryFile(max_size=DOWNLOAD_SPOOL_MAX_BYTES) as fh:
+        await asyncio.to_thread(_drain_download, MediaIoBaseDownload(fh, request_obj))
 
-        if export_mime_type:
-            result_lines.append(f"\nNote: Google native file exported to {output_mime_type} format.")
+        size_bytes = fh.tell()
+        size_kb = size_bytes / 1024 if size_bytes else 0
+        fh.seek(0)
 
-        logger.info(f"[get_drive_file_download_url] Successfully saved {size_kb:.1f} KB file as {saved_file_id}")
-        return "\n".join(result_lines)
+        try:
+            storage = get_attachment_storage()
+            saved_file_id = await asyncio.to_thread(
+                storage.save_attachment_file,
+                fh,
+                filename=output_filename,
+                mime_type=output_mime_type,
+            )
 
-    except Exception as e:
-        logger.error(f"[get_drive_file_download_url] Failed to save file: {e}")
-        return (
-            f"Error: Failed to save file for download.\n"
-            f"File was downloaded successfully ({size_kb:.1f} KB) but could not be saved.\n\n"
-            f"Error details: {str(e)}"
-        )
+            download_url = get_attachment_url(saved_file_id)
+
+            result_lines = [
+                "File downloaded successfully!",
+                f"File: {file_name}",
+                f"File ID: {file_id}",
+                f"Size: {size_kb:.1f} KB ({size_bytes} bytes)",
+                f"MIME Type: {output_mime_type}",
+                f"\nDownload URL: {download_url}",
+                "\nThe file has been saved and is available at the URL above.",
+                "The file will expire after 1 hour.",
+            ]
+
+            if export_mime_type:
+                result_lines.append(f"\nNote: Google native file exported to {output_mime_type} format.")
+
+            logger.info(f"[get_drive_file_download_url] Successfully saved {size_kb:.1f} KB file as {saved_file_id}")
+            return "\n".join(result_lines)
+
+        except Exception as e:
+            logger.error(f"[get_drive_file_download_url] Failed to save file: {e}")
+            return (
+                f"Error: Failed to save file for download.\n"
+                f"File was downloaded successfully ({size_kb:.1f} KB) but could not be saved.\n\n"
+                f"Error details: {str(e)}"
+            )
 
 
 @server.tool()
@@ -315,79 +361,81 @@ async def create_drive_file(
         logger.info("[create_drive_file] Dry run enabled; skipping create mutation.")
         return dry_run_message
 
-    file_data = None
     created_file = None
-    resolved_folder_id = await resolve_folder_id(service, folder_id)
+    # The folder lookup only needs the Drive service, so it runs while any fileUrl is fetched
+    folder_task = asyncio.create_task(resolve_folder_id(service, folder_id))
 
-    file_metadata = {
+    file_metadata: dict = {
         "name": file_name,
-        "parents": [resolved_folder_id],
         "mimeType": mime_type,
     }
 
-    if fileUrl:
-        logger.info(f"[create_drive_file] Fetching file from URL: {fileUrl}")
-
-        parsed_url = urlparse(fileUrl)
-        if parsed_url.scheme == "file":
-            logger.info("[create_drive_file] Detected file:// URL, reading from local filesystem")
-            transport_mode = get_transport_mode()
-            running_streamable = transport_mode == "streamable-http"
-            if running_streamable:
-                logger.warning(
-                    "[create_drive_file] file:// URL requested while server runs in streamable-http mode. Ensure the file path is accessible to the server (e.g., Docker volume) or use an HTTP(S) URL."
-                )
+    try:
+        if fileUrl:
+            logger.info(f"[create_drive_file] Fetching file from URL: {fileUrl}")
+
+            parsed_url = urlparse(fileUrl)
+            if parsed_url.scheme == "file":
+                logger.info("[create_drive_file] Detected file:// URL, reading from local filesystem")
+                transport_mode = get_transport_mode()
+                running_streamable = transport_mode == "streamable-http"
+                if running_streamable:
+                    logger.warning(
+                        "[create_drive_file] file:// URL requested while server runs in streamable-http mode. Ensure the file path is accessible to the server (e.g., Docker volume) or use an HTTP(S) URL."
+                    )
 
-            raw_path = parsed_url.path or ""
-            netloc = parsed_url.netloc
-            if netloc and netloc.lower() != "localhost":
-                raw_path = f"//{netloc}{raw_path}"
-            file_path = url2pathname(raw_path)
-
-            path_obj = Path(file_path)
-            if not path_obj.exists():
-                extra = (
-                    " The server is running via streamable-http, so file:// URLs must point to files inside the container or remote host."
-                    if running_streamable
-                    else ""
-                )
-                raise ValidationError(f"Local file does not exist: {file_path}.{extra}")
-            if not path_obj.is_file():
-                extra = (
-                    " In streamable-http/Docker deployments, mount the file into the container or provide an HTTP(S) URL."
-                    if running_streamable
-                    else ""
-                )
-                raise ValidationError(f"Path is not a file: {file_path}.{extra}")
+                raw_path = parsed_url.path or ""
+                netloc = parsed_url.netloc
+                if netloc and netloc.lower() != "localhost":
+                    raw_path = f"//{netloc}{raw_path}"
+                file_path = url2pathname(raw_path)
+
+                path_obj = Path(file_path)
+                if not path_obj.exists():
+                    extra = (
+                        " The server is running via streamable-http, so file:// URLs must point to files inside the container or remote host."
+                        if running_streamable
+                        else ""
+                    )
+                    raise ValidationError(f"Local file does not exist: {file_path}.{extra}")
+                if not path_obj.is_file():
+                    extra = (
+                        " In streamable-http/Docker deployments, mount the file into the container or provide an HTTP(S) URL."
+                        if running_streamable
+                        else ""
+                    )
+                    raise ValidationError(f"Path is not a file: {file_path}.{extra}")
 
-            logger.info(f"[create_drive_file] Reading local file: {file_path}")
+                logger.info(f"[create_drive_file] Reading local file: {file_path}")
 
-            file_data = await asyncio.to_thread(path_obj.read_bytes)
-            total_bytes = len(file_data)
-            logger.info(f"[create_drive_file] Read {total_bytes} bytes from local file")
+                total_bytes = path_obj.stat().st_size
+                logger.info(f"[create_drive_file] Local file is {total_bytes} bytes")
 
-            media = MediaIoBaseUpload(
-                io.BytesIO(file_data),
-                mimetype=mime_type,
-                resumable=True,
-                chunksize=UPLOAD_CHUNK_SIZE_BYTES,
-            )
+                # The resumable upload reads the handle one chunk at a time, so the file is never fully in memory
+                with path_obj.open("rb") as local_file:
+                    media = MediaIoBaseUpload(
+                        local_file,
+                        mimetype=mime_type,
+                        resumable=True,
+                        chunksize=UPLOAD_CHUNK_SIZE_BYTES,
+                    )
 
-            logger.info("[create_drive_file] Starting upload to Google Drive...")
-            created_file = await asyncio.to_thread(
-                service.files()
-                .create(
-                    body=file_metadata,
-                    media_body=media,
-                    fields="id, name, webViewLink",
-                    supportsAllDrives=True,
-                )
-                .execute
-            )
-        elif parsed_url.scheme in ("http", "https"):
-            if is_stateless_mode():
-                async with httpx.AsyncClient(follow_redirects=True) as client:
-                    resp = await client.get(fileUrl)
+                    logger.info("[create_drive_file] Starting upload to Google Drive...")
+                    file_metadata["parents"] = [await folder_task]
+                    created_file = await asyncio.to_thread(
+                        service.files()
+                        .create(
+                            body=file_metadata,
+                            media_body=media,
+                            fields="id, name, webViewLink",
+                            supportsAllDrives=True,
+                        )
+                        .execute
+                    )
+            elif parsed_url.scheme in ("http", "https"):
+                if is_stateless_mode():
+                    http_client = await _get_http_client()
+                    resp = await http_client.get(fileUrl)
                     if resp.status_code != 200:
                         raise ValidationError(f"Failed to fetch file from URL: {fileUrl} (status {resp.status_code})")
                     file_data = await resp.aread()
@@ -397,28 +445,28 @@ async def create_drive_file(
                         file_metadata["mimeType"] = content_type
                         logger.info(f"[create_drive_file] Using MIME type from Content-Type header: {content_type}")
 
-                media = MediaIoBaseUpload(
-                    io.BytesIO(file_data),
-                    mimetype=mime_type,
-                    resumable=True,
-                    chunksize=UPLOAD_CHUNK_SIZE_BYTES,
-                )
+                    media = MediaIoBaseUpload(
+                        io.BytesIO(file_data),
+                        mimetype=mime_type,
+                        resumable=True,
+                        chunksize=UPLOAD_CHUNK_SIZE_BYTES,
+                    )
 
-                created_file = await asyncio.to_thread(
-                    service.files()
-                    .create(
-                        body=file_metadata,
-                        media_body=media,
-                        fields="id, name, webViewLink",
-                        supportsAllDrives=True,
+                    file_metadata["parents"] = [await folder_task]
+                    created_file = await asyncio.to_thread(
+                        service.files()
+                        .create(
+                            body=file_metadata,
+                            media_body=media,
+                            fields="id, name, webViewLink",
+                            supportsAllDrives=True,
+                        )
+                        .execute
                     )
-                    .execute
-                )
-            else:
-                with NamedTemporaryFile() as temp_file:
-                    total_bytes = 0
-                    async with httpx.AsyncClient(follow_redirects=True) as client:
-                        async with client.stream("GET", fileUrl) as resp:
+                else:
+                    with NamedTemporaryFile() as temp_file:
+                        http_client = await _get_http_client()
+                        async with http_client.stream("GET", fileUrl) as resp:
                             if resp.status_code != 200:
                                 raise ValidationError(
                                     f"Failed to fetch file from URL: {fileUrl} (status {resp.status_code})"
@@ -426,9 +474,10 @@ async def create_drive_file(
 
                             async for chunk in resp.aiter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE_BYTES):
                                 await asyncio.to_thread(temp_file.write, chunk)
-                                total_bytes += len(chunk)
 
-                            logger.info(f"[create_drive_file] Downloaded {total_bytes} bytes from URL before upload.")
+                            logger.info(
+                                f"[create_drive_file] Downloaded {temp_file.tell()} bytes from URL before upload."
+                            )
 
                             content_type = resp.headers.get("Content-Type")
                             if content_type and content_type != "application/octet-stream":
@@ -438,46 +487,53 @@ async def create_drive_file(
                                     f"[create_drive_file] Using MIME type from Content-Type header: {mime_type}"
                                 )
 
-                    temp_file.seek(0)
+                        temp_file.seek(0)
 
-                    media = MediaIoBaseUpload(
-                        temp_file,
-                        mimetype=mime_type,
-                        resumable=True,
-                        chunksize=UPLOAD_CHUNK_SIZE_BYTES,
-                    )
+                        media = MediaIoBaseUpload(
+                            temp_file,
+                            mimetype=mime_type,
+                            resumable=True,
+                            chunksize=UPLOAD_CHUNK_SIZE_BYTES,
+                        )
 
-                    logger.info("[create_drive_file] Starting upload to Google Drive...")
-                    created_file = await asyncio.to_thread(
-                        service.files()
-                        .create(
-                            body=file_metadata,
-                            media_body=media,
-                            fields="id, name, webViewLink",
-                            supportsAllDrives=True,
+                        logger.info("[create_drive_file] Starting upload to Google Drive...")
+                        file_metadata["parents"] = [await folder_task]
+                        created_file = await asyncio.to_thread(
+                            service.files()
+                            .create(
+                                body=file_metadata,
+                                media_body=media,
+                                fields="id, name, webViewLink",
+                                supportsAllDrives=True,
+                            )
+                            .execute
                         )
-                        .execute
-                    )
-        else:
-            if not parsed_url.scheme:
-                raise ValidationError("fileUrl is missing a URL scheme. Use file://, http://, or https://.")
-            raise ValidationError(
-                f"Unsupported URL scheme '{parsed_url.scheme}'. Only file://, http://, and https:// are supported."
-            )
-    elif content:
-        file_data = content.encode("utf-8")
-        media = io.BytesIO(file_data)
-
-        created_file = await asyncio.to_thread(
-            service.files()
-            .create(
-                body=file_metadata,
-                media_body=MediaIoBaseUpload(media, mimetype=mime_type, resumable=True),
-                fields="id, name, webViewLink",
-                supportsAllDrives=True,
+            else:
+                if not parsed_url.scheme:
+                    raise ValidationError("fileUrl is missing a URL scheme. Use file://, http://, or https://.")
+                raise ValidationError(
+                    f"Unsupported URL scheme '{parsed_url.scheme}'. Only file://, http://, and https:// are supported."
+                )
+        elif content:
+            media = io.BytesIO(content.encode("utf-8"))
+
+            file_metadata["parents"] = [await folder_task]
+            created_file = await asyncio.to_thread(
+                service.files()
+                .create(
+                    body=file_metadata,
+                    media_body=MediaIoBaseUpload(media, mimetype=mime_type, resumable=True),
+                    fields="id, name, webViewLink",
+                    supportsAllDrives=True,
+                )
+                .execute
             )
-            .execute
-        )
+    finally:
+        if not folder_task.done():
+            folder_task.cancel()
+        elif not folder_task.cancelled():
+            # The fetch error is the one reported; retrieve a failed lookup's error so asyncio does not log it
+            folder_task.exception()
 
     if created_file is None:
         raise ValidationError("Failed to create file - no content source was processed.")
@@ -620,6 +676,7 @@ async def update_drive_file(
         query_params["body"] = update_body
 
     updated_file = await asyncio.to_thread(service.files().update(**query_params).execute)
+    forget_drive_item(file_id)
 
     output_parts = [f"Successfully updated file: {updated_file.get('name', current_file['name'])}"]
     output_parts.append(f"   File ID: {file_id}")
@@ -639,25 +696,16 @@ async def update_drive_file(
         changes.append(f"   - Added to folder(s): {add_parents}")
     if remove_parents:
         changes.append(f"   - Removed from folder(s): {remove_parents}")
-    current_starred = current_file.get("starred")
-    if starred is not None and starred != current_starred:
-        star_status = "starred" if starred else "unstarred"
-        changes.append(f"   - File {star_status}")
-    current_trashed = current_file.get("trashed")
-    if trashed is not None and trashed != current_trashed:
-        trash_status = "moved to trash" if trashed else "restored from trash"
-        changes.append(f"   - File {trash_status}")
-    current_writers_can_share = current_file.get("writersCanShare")
-    if writers_can_share is not None and writers_can_share != current_writers_can_share:
-        share_status = "can" if writers_can_share else "cannot"
-        changes.append(f"   - Writers {share_status} share the file")
-    current_copy_requires_writer_permission = current_file.get("copyRequiresWriterPermission")
-    if (
-        copy_requires_writer_permission is not None
-        and copy_requires_writer_permission != current_copy_requires_writer_permission
-    ):
-        copy_status = "requires" if copy_requires_writer_permission else "doesn't require"
-        changes.append(f"   - Copying {copy_status} writer permission")
+    new_flags = {
+        "starred": starred,
+        "trashed": trashed,
+        "writersCanShare": writers_can_share,
+        "copyRequiresWriterPermission": copy_requires_writer_permission,
+    }
+    for field, set_message, cleared_message in _FLAG_CHANGE_MESSAGES:
+        new_value = new_flags[field]
+        if new_value is not None and new_value != current_file.get(field):
+            changes.append(f"   - {set_message if new_value else cleared_message}")
     if properties:
         changes.append(f"   - Updated custom properties: {properties}")
 
@@ -16,6 +16,7 @@ from core.server import server
 from core.utils import handle_http_errors
 from gdrive.drive_helpers import (
     check_public_link_permission,
+    forget_drive_item,
     format_permission_info,
     resolve_drive_item,
     validate_expiration_time,
@@ -25,6 +26,8 @@ from gdrive.drive_helpers import (
 
 logger = logging.getLogger(__name__)
 
+DRIVE_BATCH_SIZE = 100  # Drive accepts at most 100 calls per batch request
+
 
 class ShareRecipient(BaseModel):
     """Model for a share recipient in batch operations."""
@@ -38,6 +41,25 @@ class ShareRecipient(BaseModel):
     )
 
 
+def _permission_create_params(
+    file_id: str, permission_body: dict, send_notification: bool, email_message: str | None
+) -> dict:
+    """Build permissions().create kwargs; notification options only apply to user and group shares."""
+    create_params: dict = {
+        "fileId": file_id,
+        "body": permission_body,
+        "supportsAllDrives": True,
+        "fields": "id, type, role, emailAddress, domain, expirationTime",
+    }
+
+    if permission_body["type"] in ("user", "group"):
+        create_params["sendNotificationEmail"] = send_notification
+        if email_message:
+            create_params["emailMessage"] = email_message
+
+    return create_params
+
+
 @server.tool()
 @handle_http_errors("get_drive_file_permissions", is_read_only=True, service_type="drive")
 @require_google_service("drive", "drive_read")
@@ -58,22 +80,17 @@ async def get_drive_file_permissions(
     """
     logger.info(f"[get_drive_file_permissions] Checking file {file_id} for {user_google_email}")
 
-    resolved_file_id, _ = await resolve_drive_item(service, file_id)
+    # The resolution lookup already returns the item's metadata, so request everything shown below with it
+    resolved_file_id, file_metadata = await resolve_drive_item(
+        service,
+        file_id,
+        extra_fields="name, size, modifiedTime, owners, "
+        "permissions(id, type, role, emailAddress, domain, expirationTime, permissionDetails), "
+        "webViewLink, webContentLink, shared, sharingUser, viewersCanCopyContent",
+    )
     file_id = resolved_file_id
 
     try:
-        file_metadata = await asyncio.to_thread(
-            service.files()
-            .get(
-                fileId=file_id,
-                fields="id, name, mimeType, size, modifiedTime, owners, "
-                "permissions(id, type, role, emailAddress, domain, expirationTime, permissionDetails), "
-                "webViewLink, webContentLink, shared, sharingUser, viewersCanCopyContent",
-                supportsAllDrives=True,
-            )
-            .execute
-        )
-
         output_parts = [
             f"File: {file_metadata.get('name', 'Unknown')}",
             f"ID: {file_id}",
@@ -95,8 +112,7 @@ async def get_drive_file_permissions(
         if permissions:
             output_parts.append(f"  Number of permissions: {len(permissions)}")
             output_parts.append("  Permissions:")
-            for perm in permissions:
-                output_parts.append(f"    - {format_permission_info(perm)}")
+            output_parts.extend(f"    - {format_permission_info(perm)}" for perm in permissions)
         else:
             output_parts.append("  No additional permissions (private file)")
 
@@ -157,19 +173,13 @@ async def get_drive_shareable_link(
     """
     logger.info(f"[get_drive_shareable_link] Invoked. Email: '{user_google_email}', File ID: '{file_id}'")
 
-    resolved_file_id, _ = await resolve_drive_item(service, file_id)
-    file_id = resolved_file_id
-
-    file_metadata = await asyncio.to_thread(
-        service.files()
-        .get(
-            fileId=file_id,
-            fields="id, name, mimeType, webViewLink, webContentLink, shared, "
-            "permissions(id, type, role, emailAddress, domain, expirationTime)",
-            supportsAllDrives=True,
-        )
-        .execute
+    resolved_file_id, file_metadata = await resolve_drive_item(
+        service,
+        file_id,
+        extra_fields="name, webViewLink, webContentLink, shared, "
+        "permissions(id, type, role, emailAddress, domain, expirationTime)",
     )
+    file_id = resolved_file_id
 
     output_parts = [
         f"File: {file_metadata.get('name', 'Unknown')}",
@@ -189,8 +199,7 @@ async def get_drive_shareable_link(
     if permissions:
         output_parts.append("")
         output_parts.append("Current permissions:")
-        for perm in permissions:
-            output_parts.append(f"  - {format_permission_info(perm)}")
+        output_parts.extend(f"  - {format_permission_info(perm)}" for perm in permissions)
 
     return "\n".join(output_parts)
 
@@ -278,21 +287,12 @@ async def share_drive_file(
         logger.info("[share_drive_file] Dry run enabled; skipping permission create mutation.")
         return "\n".join(preview_lines)
 
-    resolved_file_id, file_metadata = await resolve_drive_item(service, file_id, extra_fields="name, webViewLink")
+    resolved_file_id, file_metadata = await resolve_drive_item(
+        service, file_id, extra_fields="name, webViewLink", cache_user=user_google_email
+    )
     file_id = resolved_file_id
 
-    create_params: dict = {
-        "fileId": file_id,
-        "body": permission_body,
-        "supportsAllDrives": True,
-        "fields": "id, type, role, emailAddress, domain, expirationTime",
-    }
-
-    if share_type in ("user", "group"):
-        create_params["sendNotificationEmail"] = send_notification
-        if email_message:
-            create_params["emailMessage"] = email_message
-
+    create_params = _permission_create_params(file_id, permission_body, send_notification, email_message)
     created_permission = await asyncio.to_thread(service.permissions().create(**create_params).execute)
 
     output_parts = [
@@ -324,8 +324,7 @@ async def batch_share_drive_file(
 
     Each recipient can have a different role and optional expiration time.
 
-    Note: Each recipient is processed sequentially. For very large recipient lists,
-    consider splitting into multiple calls.
+    Permissions are created through Drive batch requests of up to 100 recipients each.
 
     Args:
         user_google_email (str): The user's Google email address. Required.
@@ -391,14 +390,15 @@ async def batch_share_drive_file(
         logger.info("[batch_share_drive_file] Dry run enabled; skipping batch permission create mutations.")
         return "\n".join(output_parts)
 
-    resolved_file_id, file_metadata = await resolve_drive_item(service, file_id, extra_fields="name, webViewLink")
-    file_id = resolved_file_id
-
-    results = []
+    # Validate every recipient before any Drive call, so a malformed entry costs no round trips
+    # and never leaves part of the list shared
+    results: list[str] = [""] * len(recipients)
     success_count = 0
     failure_count = 0
+    # (recipient position, identifier, permission body) for recipients that passed validation
+    pending: list[tuple[int, str, dict]] = []
 
-    for recipient in recipients:
+    for position, recipient in enumerate(recipients):
         share_type = recipient.share_type
         role = recipient.role
         expiration_time = recipient.expiration_time
@@ -406,14 +406,14 @@ async def batch_share_drive_file(
         if share_type == "domain":
             domain = recipient.domain
             if not domain:
-                results.append("  - Skipped: missing domain for domain share")
+                results[position] = "  - Skipped: missing domain for domain share"
                 failure_count += 1
                 continue
             identifier = domain
         else:
             email = recipient.email
             if not email:
-                results.append("  - Skipped: missing email address")
+                results[position] = "  - Skipped: missing email address"
                 failure_count += 1
                 continue
             identifier = email
@@ -433,29 +433,43 @@ async def batch_share_drive_file(
                 validate_expiration_time(expiration_time)
                 permission_body["expirationTime"] = expiration_time
             except ValueError as e:
-                results.append(f"  - {identifier}: Failed - {e}")
+                results[position] = f"  - {identifier}: Failed - {e}"
                 failure_count += 1
                 continue
 
-        create_params: dict = {
-            "fileId": file_id,
-            "body": permission_body,
-            "supportsAllDrives": True,
-            "fields": "id, type, role, emailAddress, domain, expirationTime",
-        }
+        pending.append((position, identifier, permission_body))
 
-        if share_type in ("user", "group"):
-            create_params["sendNotificationEmail"] = send_notification
-            if email_message:
-                create_params["emailMessage"] = email_message
+    resolved_file_id, file_metadata = await resolve_drive_item(
+        service, file_id, extra_fields="name, webViewLink", cache_user=user_google_email
+    )
+    file_id = resolved_file_id
+
+    for chunk_start in range(0, len(pending), DRIVE_BATCH_SIZE):
+        chunk = pending[chunk_start : chunk_start + DRIVE_BATCH_SIZE]
+        responses: dict[str, tuple[dict | None, Exception | None]] = {}
+
+        def _batch_callback(request_id, response, exception, responses=responses):
+            responses[request_id] = (response, exception)
+
+        batch = service.new_batch_http_request(callback=_batch_callback)
+        for position, _, permission_body in chunk:
+            create_params = _permission_create_params(file_id, permission_body, send_notification, email_message)
+            batch.add(service.permissions().create(**create_params), request_id=str(position))
 
         try:
-            created_permission = await asyncio.to_thread(service.permissions().create(**create_params).execute)
-            results.append(f"  - {format_permission_info(created_permission)}")
-            success_count += 1
+            await asyncio.to_thread(batch.execute)
         except HttpError as e:
-            results.append(f"  - {identifier}: Failed - {str(e)}")
-            failure_count += 1
+            for position, _, _ in chunk:
+                responses.setdefault(str(position), (None, e))
+
+        for position, identifier, _ in chunk:
+            created_permission, error = responses.get(str(position), (None, None))
+            if created_permission is not None and error is None:
+                results[position] = f"  - {format_permission_info(created_permission)}"
+                success_count += 1
+            else:
+                results[position] = f"  - {identifier}: Failed - {error or 'no response in batch'}"
+                failure_count += 1
 
     output_parts = [
         f"Batch share results for '{file_metadata.get('name', 'Unknown')}'",
@@ -523,23 +537,15 @@ async def update_drive_permission(
         logger.info("[update_drive_permission] Dry run enabled; skipping permission update mutation.")
         return "\n".join(output_parts)
 
-    resolved_file_id, file_metadata = await resolve_drive_item(service, file_id, extra_fields="name")
+    resolved_file_id, file_metadata = await resolve_drive_item(
+        service, file_id, extra_fields="name", cache_user=user_google_email
+    )
     file_id = resolved_file_id
 
-    if not role:
-        current_permission = await asyncio.to_thread(
-            service.permissions()
-            .get(
-                fileId=file_id,
-                permissionId=permission_id,
-                supportsAllDrives=True,
-                fields="role",
-            )
-            .execute
-        )
-        role = current_permission.get("role")
-
-    update_body: dict = {"role": role}
+    # permissions.update is a patch: an omitted role stays as it is
+    update_body: dict = {}
+    if role:
+        update_body["role"] = role
     if expiration_time:
         update_body["expirationTime"] = expiration_time
 
@@ -595,7 +601,9 @@ async def remove_drive_permission(
         logger.info("[remove_drive_permission] Dry run enabled; skipping permission delete mutation.")
         return f"DRY RUN: Would remove permission '{permission_id}' from file '{file_id}' for {user_google_email}."
 
-    resolved_file_id, file_metadata = await resolve_drive_item(service, file_id, extra_fields="name")
+    resolved_file_id, file_metadata = await resolve_drive_item(
+        service, file_id, extra_fields="name", cache_user=user_google_email
+    )
     file_id = resolved_file_id
 
     await asyncio.to_thread(
@@ -651,7 +659,9 @@ async def transfer_drive_ownership(
         logger.info("[transfer_drive_ownership] Dry run enabled; skipping transfer mutation.")
         return "\n".join(output_parts)
 
-    resolved_file_id, file_metadata = await resolve_drive_item(service, file_id, extra_fields="name, owners")
+    resolved_file_id, file_metadata = await resolve_drive_item(
+        service, file_id, extra_fields="name, owners", cache_user=user_google_email
+    )
     file_id = resolved_file_id
 
     current_owners = file_metadata.get("owners", [])
@@ -675,6 +685,7 @@ async def transfer_drive_ownership(
         )
         .execute
     )
+    forget_drive_item(file_id)
 
     output_parts = [
         f"Successfully transferred ownership of '{file_metadata.get('name', 'Unknown')}'",
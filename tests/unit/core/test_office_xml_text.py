@@ -0,0 +1,58 @@
+"""Tests for Office XML text extraction."""
+
+import io
+import logging
+import tempfile
+import zipfile
+
+from core.utils import extract_office_xml_text
+
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def _make_docx(*paragraphs: str) -> bytes:
+    body = "".join(f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>" for text in paragraphs)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("word/document.xml", f'<w:document xmlns:w="{W_NS}"><w:body>{body}</w:body></w:document>')
+    return buffer.getvalue()
+
+
+class _NoSeekableReader:
+    """Binary reader without seekable(), like SpooledTemporaryFile before Python 3.11."""
+
+    def __init__(self, data: bytes):
+        self._buffer = io.BytesIO(data)
+        self.read = self._buffer.read
+        self.seek = self._buffer.seek
+        self.tell = self._buffer.tell
+
+
+class TestExtractOfficeXmlText:
+    """Test extract_office_xml_text inputs."""
+
+    def test_docx_bytes(self):
+        assert extract_office_xml_text(_make_docx("Hello", "World"), DOCX_MIME) == "Hello World"
+
+    def test_docx_spooled_file_matches_bytes(self):
+        data = _make_docx("Hello", "World")
+        with tempfile.SpooledTemporaryFile(max_size=16) as fh:
+            fh.write(data)
+            fh.seek(0)
+            assert extract_office_xml_text(fh, DOCX_MIME) == extract_office_xml_text(data, DOCX_MIME)
+
+    def test_non_zip_returns_none(self):
+        assert extract_office_xml_text(b"plain text", DOCX_MIME) is None
+
+    def test_docx_with_malformed_xml_returns_none(self):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            zf.writestr("word/document.xml", f'<w:document xmlns:w="{W_NS}"><w:body><w:t>cut')
+        assert extract_office_xml_text(buffer.getvalue(), DOCX_MIME) is None
+
+    def test_unreadable_members_are_logged(self, caplog):
+        with caplog.at_level(logging.ERROR, logger="core.utils"):
+            assert extract_office_xml_text(_NoSeekableReader(_make_docx("Hello")), DOCX_MIME) is None
+        assert "Error processing member 'word/document.xml'" in caplog.text
+        assert "1 member(s) failed to read" in caplog.text
@@ -0,0 +1,31 @@
+"""Tests for BatchOperationManager result metadata."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from gdocs.managers.batch_operation_manager import BatchOperationManager
+
+
+@pytest.mark.asyncio
+async def test_find_replace_operations_report_per_operation_counts():
+    service = MagicMock()
+    service.documents.return_value.batchUpdate.return_value.execute.return_value = {
+        "replies": [
+            {"replaceAllText": {"occurrencesChanged": 3}},
+            {},
+            {"replaceAllText": {}},
+        ]
+    }
+    operations = [
+        {"type": "find_replace", "find_text": "{{a}}", "replace_text": "A"},
+        {"type": "insert_text", "index": 1, "text": "x"},
+        {"type": "find_replace", "find_text": "{{b}}", "replace_text": "B"},
+    ]
+
+    success, _message, metadata = await BatchOperationManager(service).execute_batch_operations("doc-1", operations)
+
+    assert success
+    assert metadata["replacements"] == [3, 0]
+    body = service.documents.return_value.batchUpdate.call_args.kwargs["body"]
+    assert len(body["requests"]) == 3
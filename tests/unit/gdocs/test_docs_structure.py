@@ -0,0 +1,43 @@
+"""Unit tests for Google Docs structure parsing helpers."""
+
+from gdocs.docs_structure import find_tables, parse_document_structure
+
+
+def _paragraph(start, end, text):
+    return {"startIndex": start, "endIndex": end, "paragraph": {"elements": [{"textRun": {"content": text}}]}}
+
+
+def _table(start, end, rows, cols):
+    return {
+        "startIndex": start,
+        "endIndex": end,
+        "table": {
+            "tableRows": [
+                {"tableCells": [{"startIndex": start + 1, "endIndex": start + 2, "content": []}] * cols}
+                for _ in range(rows)
+            ]
+        },
+    }
+
+
+def test_find_tables_matches_full_structure_parse():
+    doc = {
+        "body": {
+            "content": [
+                _paragraph(1, 5, "abc\n"),
+                _table(5, 20, 2, 3),
+                _paragraph(20, 25, "defg\n"),
+                _table(25, 40, 1, 1),
+            ]
+        }
+    }
+
+    tables = find_tables(doc)
+    parsed_tables = parse_document_structure(doc)["tables"]
+
+    assert [table["index"] for table in tables] == [0, 1]
+    assert [(table["rows"], table["columns"]) for table in tables] == [(2, 3), (1, 1)]
+    for table, parsed in zip(tables, parsed_tables, strict=True):
+        assert {key: table[key] for key in ("start_index", "end_index", "rows", "columns", "cells")} == {
+            key: parsed[key] for key in ("start_index", "end_index", "rows", "columns", "cells")
+        }
@@ -76,6 +76,16 @@ class TestConverterBasics:
         converter.convert("Second")
         assert len(converter.requests) < first_count
 
+    def test_repeated_conversion_reuses_cached_tokens(self, converter):
+        markdown = "# Cached\n\n**bold** text"
+        first = converter.convert(markdown)
+        hits_before = _mp._parse_markdown_cached.cache_info().hits
+
+        second = MarkdownToDocsConverter().convert(markdown)
+
+        assert second == first
+        assert _mp._parse_markdown_cached.cache_info().hits == hits_before + 1
+
     def test_start_index_is_customizable(self, converter):
         result = converter.convert("Hello", start_index=100)
         insert_request = result[0]
@@ -271,6 +281,19 @@ class TestLinks:
         assert range_info["startIndex"] == 1
         assert range_info["endIndex"] == 6
 
+    def test_repeated_link_urls_share_one_style(self, converter):
+        result = converter.convert("[a](https://x.test) [b](https://x.test) [c](https://y.test)")
+
+        link_urls = [
+            r["updateTextStyle"]["textStyle"]["link"]["url"]
+            for r in result
+            if "updateTextStyle" in r and "link" in r["updateTextStyle"]["textStyle"]
+        ]
+        assert link_urls == ["https://x.test", "https://x.test", "https://y.test"]
+        styles = [style for _, _, style in converter._deferred_styles]
+        assert styles[0] is styles[1]
+        assert styles[0] is not styles[2]
+
 
 class TestLists:
     def test_bullet_list_generates_bullets_request(self, converter):
@@ -445,6 +468,14 @@ class TestBlockquotes:
         italic_style = next((r for r in text_styles if r["updateTextStyle"]["textStyle"].get("italic")), None)
         assert italic_style is not None
 
+    def test_blockquote_italic_coalesces_with_inline_styles(self, converter):
+        result = converter.convert("> **Quote text**")
+
+        text_styles = [r["updateTextStyle"] for r in result if "updateTextStyle" in r]
+        assert len(text_styles) == 1
+        assert text_styles[0]["textStyle"] == {"bold": True, "italic": True}
+        assert text_styles[0]["range"] == {"startIndex": 1, "endIndex": 11}
+
     def test_nested_blockquote_increases_indent(self, converter):
         result = converter.convert("> Level 1\n>> Level 2")
 
@@ -491,12 +522,32 @@ class TestIndexTracking:
         assert converter._text_buffer == "test"
         assert converter.cursor_index == 104
 
+    def test_count_tabs_matches_slice_count(self, converter):
+        converter._insert_text("a\tb\t\tc")
+        buffer = converter._text_buffer
+
+        for start in range(len(buffer) + 1):
+            for end in range(start, len(buffer) + 2):
+                assert converter._count_tabs(start, end) == buffer[start:end].count("\t")
+
+        converter._insert_text("\t")
+        assert converter._count_tabs(0, converter._text_len) == 4
+
     def test_cursor_advances_after_insert(self, converter):
         converter.cursor_index = 1
         converter._insert_text("hello")
 
         assert converter.cursor_index == 6
 
+    def test_text_buffer_joins_buffered_chunks(self, converter):
+        converter._insert_text("hello")
+        converter._insert_text(" ")
+        converter._insert_text("world")
+
+        assert converter._text_len == 11
+        assert converter._text_buffer == "hello world"
+        assert converter._text_buffer == "hello world"
+
 
 class TestStyleStack:
     def test_push_style_adds_to_stack(self, converter):
@@ -511,6 +562,20 @@ class TestStyleStack:
 
         assert len(converter.active_styles) == 0
 
+    def test_pop_style_records_range_for_each_closed_style(self, converter):
+        bold = {"bold": True}
+        italic = {"italic": True}
+        converter._push_style(bold)
+        converter._insert_text("ab")
+        converter._push_style(italic)
+        converter._insert_text("cd")
+        converter._pop_style(italic)
+        converter._pop_style(bold)
+
+        assert converter._deferred_styles == [(2, 4, italic), (0, 4, bold)]
+        assert converter._style_start_offsets == []
+        assert converter._style_start_styles == []
+
     def test_get_merged_style_combines_all(self, converter):
         converter._push_style({"bold": True})
         converter._push_style({"italic": True})
@@ -520,6 +585,13 @@ class TestStyleStack:
         assert merged["bold"] is True
         assert merged["italic"] is True
 
+    def test_shared_inline_styles_are_not_mutated_by_merging(self, converter):
+        converter.convert("***both*** and ~~**struck**~~")
+
+        assert _mp._STYLE_BOLD == {"bold": True}
+        assert _mp._STYLE_ITALIC == {"italic": True}
+        assert _mp._STYLE_STRIKETHROUGH == {"strikethrough": True}
+
     def test_pop_link_style_finds_link(self, converter):
         converter._push_style({"bold": True})
         converter._push_style({"link": {"url": "https://test.com"}})
@@ -840,6 +912,14 @@ class TestImages:
         inline_images = [r for r in converter.requests if "insertInlineImage" in r]
         assert len(inline_images) == 0
 
+    def test_image_token_with_attr_pairs_is_buffered(self, converter):
+        from markdown_it.token import Token
+
+        token = Token(type="image", tag="img", nesting=0, attrs=[["src", "https://a.com/1.png"]], children=[])
+        converter._handle_image(token)
+
+        assert converter._pending_inline_images == [(0, "https://a.com/1.png")]
+
 
 class TestTaskLists:
     """Tests for GitHub Flavored Markdown task list support (Task 6.4)."""
@@ -881,6 +961,13 @@ class TestTaskLists:
         combined = "".join(insert_texts)
         assert CHECKBOX_CHECKED in combined
 
+    def test_raw_input_html_is_not_treated_as_checkbox(self, converter):
+        result = converter.convert('Field: <input type="checkbox" checked="checked">')
+
+        text = result[0]["insertText"]["text"]
+        assert '<input type="checkbox" checked="checked">' in text
+        assert CHECKBOX_CHECKED not in text
+
     def test_regular_list_item_has_no_checkbox(self, converter):
         result = converter.convert("- regular item")
 
@@ -1109,6 +1196,22 @@ class TestTwoPhaseRequestOrdering:
         assert len(bold_styles) >= 1, "Expected at least one bold style"
         assert len(italic_styles) >= 1, "Expected at least one italic style"
 
+    def test_same_range_flags_merge_into_one_request(self, converter):
+        result = converter.convert("~~**_all three_**~~")
+
+        style_requests = [r["updateTextStyle"] for r in result if "updateTextStyle" in r]
+        assert len(style_requests) == 1
+        assert style_requests[0]["textStyle"] == {"bold": True, "italic": True, "strikethrough": True}
+        assert style_requests[0]["fields"] == "bold,italic,strikethrough"
+
+    def test_same_range_link_and_flag_merge_without_mutating_link_style(self, converter):
+        result = converter.convert("**[bold link](https://x.test)**")
+
+        style_requests = [r["updateTextStyle"] for r in result if "updateTextStyle" in r]
+        assert len(style_requests) == 1
+        assert style_requests[0]["textStyle"] == {"bold": True, "link": {"url": "https://x.test"}}
+        assert converter._link_styles["https://x.test"] == {"link": {"url": "https://x.test"}}
+
     def test_bold_range_is_exact(self, converter):
         """Bold style range must match exactly the bold text, not bleed."""
         result = converter.convert("normal **bold** normal")
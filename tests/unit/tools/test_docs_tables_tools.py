@@ -46,6 +46,7 @@ class _ValidationManager:
 
 class _TableOperationManager:
     calls: int = 0
+    indices: list[int] = []
 
     def __init__(self, _service):
         self._service = _service
@@ -58,6 +59,7 @@ class _TableOperationManager:
         _bold_headers: bool,
     ):
         self.__class__.calls += 1
+        self.__class__.indices.append(index)
         return True, "Created table", {"rows": len(table_data), "columns": len(table_data[0]), "index": index}
 
 
@@ -122,6 +124,7 @@ def docs_tables_module():
     sys.modules["gdrive.drive_helpers"] = gdrive_helpers
 
     _TableOperationManager.calls = 0
+    _TableOperationManager.indices = []
     try:
         yield _load_tables_module()
     finally:
@@ -167,3 +170,53 @@ async def test_create_table_with_data_dry_run_false_executes_table_manager(docs_
     assert result.startswith("SUCCESS:")
     assert "Table: 2x2" in result
     assert _TableOperationManager.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_create_table_with_data_passes_given_index_through(docs_tables_module):
+    result = await docs_tables_module.create_table_with_data(
+        service=MagicMock(),
+        user_google_email="user@example.com",
+        document_id="doc-123",
+        table_data=[["H1", "H2"], ["A", "B"]],
+        index=10,
+        dry_run=False,
+    )
+
+    assert result.startswith("SUCCESS:")
+    assert _TableOperationManager.indices == [10]
+
+
+@pytest.mark.asyncio
+async def test_create_table_with_data_auto_append_uses_body_end_index(docs_tables_module):
+    service = MagicMock()
+    service.documents.return_value.get.return_value.execute.return_value = {
+        "body": {"content": [{"endIndex": 1}, {"endIndex": 42}]}
+    }
+
+    result = await docs_tables_module.create_table_with_data(
+        service=service,
+        user_google_email="user@example.com",
+        document_id="doc-123",
+        table_data=[["H1", "H2"], ["A", "B"]],
+        auto_append=True,
+        dry_run=False,
+    )
+
+    assert result.startswith("SUCCESS:")
+    assert _TableOperationManager.indices == [41]
+    service.documents.return_value.get.assert_called_once_with(documentId="doc-123", fields="body(content(endIndex))")
+
+
+@pytest.mark.asyncio
+async def test_create_table_with_data_requires_index_without_auto_append(docs_tables_module):
+    result = await docs_tables_module.create_table_with_data(
+        service=MagicMock(),
+        user_google_email="user@example.com",
+        document_id="doc-123",
+        table_data=[["H1", "H2"], ["A", "B"]],
+        dry_run=False,
+    )
+
+    assert result == "ERROR: index is required unless auto_append is True"
+    assert _TableOperationManager.calls == 0
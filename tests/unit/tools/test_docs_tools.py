@@ -386,6 +386,159 @@ class TestValidateOperation:
         assert "text" in error
 
 
+class TestExtractDocText:
+    """Tests for native Google Doc text extraction in get_doc_content."""
+
+    @staticmethod
+    def _para(text):
+        return {"paragraph": {"elements": [{"textRun": {"content": text}}]}}
+
+    def _table(self, *cells):
+        return {"table": {"tableRows": [{"tableCells": [{"content": content} for content in cells]}]}}
+
+    def test_nested_tables_keep_document_order(self):
+        """Nested table cell text is emitted in document order and blank lines are dropped."""
+        from gdocs.reading import _extract_doc_text
+
+        inner = self._table([self._para("inner\n")])
+        doc = {
+            "body": {
+                "content": [
+                    self._para("before\n"),
+                    self._table([self._para("cell 1\n"), inner], [self._para("  \n")]),
+                    self._para("after\n"),
+                ]
+            }
+        }
+
+        assert _extract_doc_text(doc) == "before\ncell 1\ninner\nafter\n"
+
+    def test_include_tables_false_skips_table_text(self):
+        """Tables are skipped entirely when include_tables is False."""
+        from gdocs.reading import _extract_doc_text
+
+        doc = {
+            "body": {"content": [self._para("before\n"), self._table([self._para("cell\n")]), self._para("after\n")]}
+        }
+
+        assert _extract_doc_text(doc, include_tables=False) == "before\nafter\n"
+
+    def test_tabs_are_walked_depth_first_with_headers(self):
+        """Each tab gets a header; child tabs are indented and follow their parent."""
+        from gdocs.reading import _extract_doc_text
+
+        def tab(title, tab_id, text, children=()):
+            return {
+                "tabProperties": {"title": title, "tabId": tab_id},
+                "documentTab": {"body": {"content": [self._para(text)]}},
+                "childTabs": list(children),
+            }
+
+        doc = {"tabs": [tab("One", "t1", "a\n", [tab("Child", "t2", "b\n")]), tab("Two", "t3", "c\n")]}
+
+        assert _extract_doc_text(doc) == (
+            "\n--- TAB: One ---\na\n\n--- TAB:     Child ( ID: t2) ---\nb\n\n--- TAB: Two ---\nc\n"
+        )
+
+
+class TestFileMetadataCache:
+    """Tests for the Drive metadata TTL cache used by get_doc_content."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        from gdocs import reading
+
+        reading._file_metadata_cache.clear()
+        yield
+        reading._file_metadata_cache.clear()
+
+    @staticmethod
+    def _service():
+        from unittest.mock import MagicMock
+
+        service = MagicMock()
+        service.files.return_value.get.return_value.execute.return_value = {"id": "doc1", "mimeType": "m"}
+        return service
+
+    @pytest.mark.asyncio
+    async def test_repeat_lookup_is_served_from_cache(self):
+        """A second lookup within the TTL does not call the Drive API again."""
+        from gdocs.reading import _get_file_metadata
+
+        service = self._service()
+        first = await _get_file_metadata(service, "user@example.com", "doc1")
+        second = await _get_file_metadata(service, "user@example.com", "doc1")
+
+        assert first == second == {"id": "doc1", "mimeType": "m"}
+        assert service.files.return_value.get.return_value.execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refetched(self, monkeypatch):
+        """Entries older than the TTL are fetched again."""
+        from gdocs import reading
+
+        service = self._service()
+        now = [1000.0]
+        monkeypatch.setattr(reading.time, "monotonic", lambda: now[0])
+
+        await reading._get_file_metadata(service, "user@example.com", "doc1")
+        now[0] += reading.FILE_METADATA_TTL_SECONDS
+        await reading._get_file_metadata(service, "user@example.com", "doc1")
+
+        assert service.files.return_value.get.return_value.execute.call_count == 2
+
+    @staticmethod
+    def _get_doc_content():
+        from gdocs import reading
+
+        function = reading.get_doc_content.fn
+        while hasattr(function, "__wrapped__"):
+            function = function.__wrapped__
+        return function
+
+    @staticmethod
+    def _doc_services():
+        from unittest.mock import MagicMock
+
+        drive_service = MagicMock()
+        drive_service.files.return_value.get.return_value.execute.return_value = {
+            "id": "doc1",
+            "name": "Doc",
+            "mimeType": "application/vnd.google-apps.document",
+        }
+        docs_service = MagicMock()
+        docs_service.documents.return_value.get.return_value.execute.return_value = {
+            "body": {"content": [{"paragraph": {"elements": [{"textRun": {"content": "hello\n"}}]}}]}
+        }
+        return drive_service, docs_service
+
+    @pytest.mark.asyncio
+    async def test_get_doc_content_fetches_metadata_and_doc_once_each(self):
+        """On a cache miss the Drive and Docs calls each run once and the doc text is returned."""
+        from gdocs import reading
+
+        drive_service, docs_service = self._doc_services()
+
+        result = await self._get_doc_content()(drive_service, docs_service, "user@example.com", "doc1")
+
+        assert result.endswith("--- CONTENT ---\nhello\n")
+        assert drive_service.files.return_value.get.return_value.execute.call_count == 1
+        assert docs_service.documents.return_value.get.return_value.execute.call_count == 1
+        assert docs_service.documents.return_value.get.call_args.kwargs["fields"] == reading.DOC_TEXT_FIELDS
+
+    @pytest.mark.asyncio
+    async def test_get_doc_content_cache_hit_fetches_doc_only(self):
+        """With cached metadata only the Docs API is called."""
+        drive_service, docs_service = self._doc_services()
+        get_doc_content = self._get_doc_content()
+
+        await get_doc_content(drive_service, docs_service, "user@example.com", "doc1")
+        await get_doc_content(drive_service, docs_service, "user@example.com", "doc1")
+
+        assert drive_service.files.return_value.get.return_value.execute.call_count == 1
+        assert docs_service.documents.return_value.get.return_value.execute.call_count == 2
+
+
 class TestToolRegistration:
     """Tests for MCP tool registration."""
 
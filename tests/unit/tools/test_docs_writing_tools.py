@@ -48,6 +48,9 @@ class _ValidationManager:
     def validate_batch_operations(self, *_args, **_kwargs):
         return True, ""
 
+    def validate_raw_requests(self, *_args, **_kwargs):
+        return True, ""
+
 
 class _BatchOperationManager:
     def __init__(self, _service):
@@ -305,6 +308,28 @@ async def test_modify_doc_text_dry_run_false_executes_batch_update(docs_writing_
     assert service.documents.return_value.batchUpdate.call_count == 1
 
 
+@pytest.mark.asyncio
+async def test_modify_doc_text_replace_at_zero_formats_inserted_text(docs_writing_module):
+    service = MagicMock()
+    service.documents.return_value.batchUpdate.return_value.execute.return_value = {}
+
+    await docs_writing_module.modify_doc_text(
+        service=service,
+        user_google_email="user@example.com",
+        document_id="a" * 24,
+        start_index=0,
+        end_index=4,
+        text="hello",
+        bold=True,
+        dry_run=False,
+    )
+
+    requests = service.documents.return_value.batchUpdate.call_args.kwargs["body"]["requests"]
+    assert requests[0] == {"insertText": {"location": {"index": 1}, "text": "hello"}}
+    assert requests[1] == {"deleteContentRange": {"range": {"startIndex": 6, "endIndex": 9}}}
+    assert requests[2]["updateTextStyle"]["range"] == {"startIndex": 1, "endIndex": 6}
+
+
 @pytest.mark.asyncio
 async def test_find_and_replace_doc_dry_run_default_skips_mutation(docs_writing_module):
     service = MagicMock()
@@ -447,3 +472,39 @@ async def test_insert_markdown_dry_run_false_executes_batch_update(docs_writing_
 
     assert "Inserted Markdown content into document" in result
     assert service.documents.return_value.batchUpdate.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_update_doc_raw_requests_sent_as_is(docs_writing_module):
+    service = MagicMock()
+    service.documents.return_value.batchUpdate.return_value.execute.return_value = {"replies": [{}]}
+    raw_requests = [{"insertText": {"location": {"index": 1}, "text": "hello"}}]
+
+    result = await docs_writing_module.batch_update_doc(
+        service=service,
+        user_google_email="user@example.com",
+        document_id="d" * 24,
+        raw_requests=raw_requests,
+        dry_run=False,
+    )
+
+    assert "Successfully executed 1 raw request(s)" in result
+    service.documents.return_value.batchUpdate.assert_called_once_with(
+        documentId="d" * 24, body={"requests": raw_requests}
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_update_doc_requires_exactly_one_input(docs_writing_module):
+    service = MagicMock()
+
+    result = await docs_writing_module.batch_update_doc(
+        service=service,
+        user_google_email="user@example.com",
+        document_id="d" * 24,
+        operations=[{"type": "insert_text", "index": 1, "text": "hello"}],
+        raw_requests=[{"insertText": {"location": {"index": 1}, "text": "hello"}}],
+    )
+
+    assert result.startswith("Error:")
+    assert service.documents.call_count == 0
@@ -9,10 +9,14 @@ Tests cover:
 - Tool registration verification
 """
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import gc
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from core.errors import ValidationError
+
 
 def _get_innermost_tool_function(tool_name: str):
     from gdrive import files as drive_files
@@ -327,6 +331,59 @@ class TestResolveFileIdOrAlias:
             assert result == "abc123xyz"
 
 
+class TestResolveDriveItemCache:
+    """Tests for the opt-in resolve_drive_item cache."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self, monkeypatch):
+        monkeypatch.setattr("gdrive.drive_helpers._drive_item_cache", {})
+
+    @staticmethod
+    def _service():
+        service = MagicMock()
+        service.files.return_value.get.return_value.execute.return_value = {
+            "id": "file-123",
+            "mimeType": "application/pdf",
+            "name": "Demo",
+        }
+        return service
+
+    @pytest.mark.asyncio
+    async def test_repeat_call_for_same_user_is_served_from_cache(self):
+        from gdrive.drive_helpers import resolve_drive_item
+
+        service = self._service()
+        first = await resolve_drive_item(service, "file-123", extra_fields="name", cache_user="a@example.com")
+        second = await resolve_drive_item(service, "file-123", extra_fields="name", cache_user="a@example.com")
+
+        assert first == second == ("file-123", {"id": "file-123", "mimeType": "application/pdf", "name": "Demo"})
+        assert service.files.return_value.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_other_user_and_uncached_calls_hit_the_api(self):
+        from gdrive.drive_helpers import resolve_drive_item
+
+        service = self._service()
+        await resolve_drive_item(service, "file-123", extra_fields="name", cache_user="a@example.com")
+        await resolve_drive_item(service, "file-123", extra_fields="name", cache_user="b@example.com")
+        await resolve_drive_item(service, "file-123", extra_fields="name")
+
+        assert service.files.return_value.get.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_forget_drive_item_and_expiry_force_a_refetch(self, monkeypatch):
+        from gdrive.drive_helpers import forget_drive_item, resolve_drive_item
+
+        service = self._service()
+        await resolve_drive_item(service, "file-123", cache_user="a@example.com")
+        forget_drive_item("file-123")
+        await resolve_drive_item(service, "file-123", cache_user="a@example.com")
+        monkeypatch.setattr("gdrive.drive_helpers.DRIVE_ITEM_CACHE_TTL_SECONDS", 0.0)
+        await resolve_drive_item(service, "file-123", cache_user="a@example.com")
+
+        assert service.files.return_value.get.call_count == 3
+
+
 class TestDriveMutatorDryRunBehavior:
     """Tests for dry-run defaults on Drive mutating tools."""
 
@@ -383,6 +440,226 @@ class TestDriveMutatorDryRunBehavior:
         assert "Successfully created file" in result
         assert service.files.return_value.create.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_create_drive_file_from_local_file_streams_upload(self, monkeypatch, tmp_path):
+        """file:// uploads should hand MediaIoBaseUpload an open file handle, not an in-memory copy."""
+        create_impl = _get_innermost_tool_function("create_drive_file")
+        local_file = tmp_path / "report.csv"
+        local_file.write_bytes(b"a,b\n1,2\n")
+        service = MagicMock()
+        uploaded = {}
+
+        def fake_execute():
+            media = service.files.return_value.create.call_args.kwargs["media_body"]
+            uploaded["stream"] = media.stream()
+            uploaded["data"] = media.getbytes(0, media.size())
+            return {"id": "file-123", "name": "report.csv", "webViewLink": "https://drive.google.com/file/d/file-123"}
+
+        service.files.return_value.create.return_value.execute.side_effect = fake_execute
+
+        async def fake_resolve_folder_id(_service, _folder_id):
+            return "resolved-folder"
+
+        monkeypatch.setattr("gdrive.files.resolve_folder_id", fake_resolve_folder_id)
+        monkeypatch.setattr("gdrive.files.get_transport_mode", lambda: "stdio")
+
+        result = await create_impl(
+            service=service,
+            user_google_email="user@example.com",
+            file_name="report.csv",
+            fileUrl=local_file.as_uri(),
+            mime_type="text/csv",
+            dry_run=False,
+        )
+
+        assert "Successfully created file" in result
+        assert uploaded["data"] == b"a,b\n1,2\n"
+        assert getattr(uploaded["stream"], "name", None) == str(local_file)
+        assert uploaded["stream"].closed
+
+    @pytest.mark.asyncio
+    async def test_create_drive_file_from_http_url_uses_shared_client(self, monkeypatch):
+        """http(s) uploads stream the body through the shared client into the Drive upload."""
+        import httpx
+
+        create_impl = _get_innermost_tool_function("create_drive_file")
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, content=b"%PDF-1.7", headers={"Content-Type": "application/pdf"})
+            )
+        )
+        service = MagicMock()
+        uploaded = {}
+
+        def fake_execute():
+            kwargs = service.files.return_value.create.call_args.kwargs
+            media = kwargs["media_body"]
+            uploaded["data"] = media.getbytes(0, media.size())
+            uploaded["mime_type"] = kwargs["body"]["mimeType"]
+            uploaded["parents"] = kwargs["body"]["parents"]
+            return {"id": "file-123", "name": "doc.pdf", "webViewLink": "https://drive.google.com/file/d/file-123"}
+
+        service.files.return_value.create.return_value.execute.side_effect = fake_execute
+
+        async def fake_resolve_folder_id(_service, _folder_id):
+            return "resolved-folder"
+
+        monkeypatch.setattr("gdrive.files.resolve_folder_id", fake_resolve_folder_id)
+        monkeypatch.setattr("gdrive.files.is_stateless_mode", lambda: False)
+        monkeypatch.setattr("gdrive.files._get_http_client", AsyncMock(return_value=client))
+
+        result = await create_impl(
+            service=service,
+            user_google_email="user@example.com",
+            file_name="doc.pdf",
+            fileUrl="https://example.com/doc.pdf",
+            dry_run=False,
+        )
+
+        assert "Successfully created file" in result
+        assert uploaded == {"data": b"%PDF-1.7", "mime_type": "application/pdf", "parents": ["resolved-folder"]}
+        assert not client.is_closed
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_create_drive_file_failed_fetch_cancels_folder_lookup(self, monkeypatch):
+        """A failed fileUrl fetch reports the fetch error and stops the pending folder lookup."""
+        import httpx
+
+        create_impl = _get_innermost_tool_function("create_drive_file")
+        lookup_started = asyncio.Event()
+
+        async def handler(request):
+            # Only answer once the folder lookup is in flight, proving the two overlap
+            await lookup_started.wait()
+            return httpx.Response(404)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        lookup_cancelled = False
+
+        async def slow_resolve_folder_id(_service, _folder_id):
+            nonlocal lookup_cancelled
+            lookup_started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                lookup_cancelled = True
+                raise
+
+        monkeypatch.setattr("gdrive.files.resolve_folder_id", slow_resolve_folder_id)
+        monkeypatch.setattr("gdrive.files.is_stateless_mode", lambda: False)
+        monkeypatch.setattr("gdrive.files._get_http_client", AsyncMock(return_value=client))
+
+        with pytest.raises(ValidationError, match="status 404"):
+            await create_impl(
+                service=MagicMock(),
+                user_google_email="user@example.com",
+                file_name="doc.pdf",
+                fileUrl="https://example.com/doc.pdf",
+                dry_run=False,
+            )
+        await asyncio.sleep(0)
+
+        assert lookup_cancelled
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_create_drive_file_failed_fetch_retrieves_failed_folder_lookup(self, monkeypatch):
+        """A folder lookup that already failed has its error retrieved when the fetch fails too."""
+        import httpx
+
+        create_impl = _get_innermost_tool_function("create_drive_file")
+        lookup_failed = asyncio.Event()
+        tasks = []
+
+        async def handler(request):
+            await lookup_failed.wait()
+            return httpx.Response(404)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        async def failing_resolve_folder_id(_service, _folder_id):
+            tasks.append(asyncio.current_task())
+            lookup_failed.set()
+            raise ValidationError("not a folder")
+
+        monkeypatch.setattr("gdrive.files.resolve_folder_id", failing_resolve_folder_id)
+        loop = asyncio.get_running_loop()
+        unhandled = []
+        monkeypatch.setattr(loop, "call_exception_handler", unhandled.append)
+        monkeypatch.setattr("gdrive.files.is_stateless_mode", lambda: False)
+        monkeypatch.setattr("gdrive.files._get_http_client", AsyncMock(return_value=client))
+
+        with pytest.raises(ValidationError, match="status 404"):
+            await create_impl(
+                service=MagicMock(),
+                user_google_email="user@example.com",
+                file_name="doc.pdf",
+                fileUrl="https://example.com/doc.pdf",
+                dry_run=False,
+            )
+
+        assert tasks[0].done()
+        tasks.clear()
+        gc.collect()
+
+        assert unhandled == []
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_http_client_is_reused_within_a_loop(self):
+        from gdrive.files import _get_http_client
+
+        client = await _get_http_client()
+        assert await _get_http_client() is client
+        await client.aclose()
+        replacement = await _get_http_client()
+        assert replacement is not client
+        await replacement.aclose()
+
+    @pytest.mark.asyncio
+    async def test_http_client_from_another_loop_is_closed_when_replaced(self, monkeypatch):
+        import httpx
+
+        from gdrive.files import _get_http_client
+
+        stale = httpx.AsyncClient()
+        monkeypatch.setattr("gdrive.files._http_client", stale)
+        monkeypatch.setattr("gdrive.files._http_client_loop", object())
+
+        replacement = await _get_http_client()
+
+        assert replacement is not stale
+        assert stale.is_closed
+        await replacement.aclose()
+
+    @pytest.mark.asyncio
+    async def test_http_client_does_not_carry_cookies_between_fetches(self, monkeypatch):
+        import functools
+
+        import httpx
+
+        from gdrive.files import _get_http_client
+
+        sent_cookies = []
+
+        def handler(request):
+            sent_cookies.append(request.headers.get("cookie"))
+            return httpx.Response(200, headers={"set-cookie": "session=user-a; Path=/"}, content=b"ok")
+
+        monkeypatch.setattr(
+            httpx, "AsyncClient", functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler))
+        )
+        monkeypatch.setattr("gdrive.files._http_client", None)
+
+        client = await _get_http_client()
+        await client.get("https://files.example.com/a.txt")
+        await client.get("https://files.example.com/b.txt")
+
+        assert sent_cookies == [None, None]
+        assert len(client.cookies.jar) == 0
+        await client.aclose()
+
     @pytest.mark.asyncio
     async def test_update_drive_file_dry_run_skips_resolution_and_mutation(self, monkeypatch):
         """Default dry-run should skip file resolution and update mutation."""
@@ -444,6 +721,59 @@ class TestDriveMutatorDryRunBehavior:
         assert "Successfully updated file" in result
         assert service.files.return_value.update.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_update_drive_file_reports_only_changed_flags(self, monkeypatch):
+        """Flag change lines appear only for values that differ from the current file."""
+        update_impl = _get_innermost_tool_function("update_drive_file")
+        service = MagicMock()
+        service.files.return_value.update.return_value.execute.return_value = {"name": "Doc"}
+
+        async def fake_resolve_drive_item(_service, _file_id, extra_fields=None):
+            return "resolved-file", {
+                "name": "Doc",
+                "starred": False,
+                "trashed": False,
+                "writersCanShare": True,
+                "copyRequiresWriterPermission": False,
+            }
+
+        monkeypatch.setattr("gdrive.files.resolve_drive_item", fake_resolve_drive_item)
+
+        result = await update_impl(
+            service=service,
+            user_google_email="user@example.com",
+            file_id="file-123",
+            starred=True,
+            trashed=False,
+            writers_can_share=False,
+            dry_run=False,
+        )
+
+        assert "   - File starred" in result
+        assert "   - Writers cannot share the file" in result
+        assert "trash" not in result
+        assert "Copying" not in result
+
+
+class _FakeBatch:
+    """Stand-in for BatchHttpRequest that runs each added request and reports it to the callback."""
+
+    def __init__(self, callback):
+        self._callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        from googleapiclient.errors import HttpError
+
+        for request_id, request in self.requests:
+            try:
+                self._callback(request_id, request.execute(), None)
+            except HttpError as e:
+                self._callback(request_id, None, e)
+
 
 class TestDrivePermissionMutatorDryRunBehavior:
     """Tests for dry-run defaults on Drive permission mutating tools."""
@@ -455,7 +785,7 @@ class TestDrivePermissionMutatorDryRunBehavior:
         service = MagicMock()
         resolve_called = False
 
-        async def fake_resolve_drive_item(_service, _file_id, extra_fields=None):
+        async def fake_resolve_drive_item(_service, _file_id, extra_fields=None, cache_user=None):
             nonlocal resolve_called
             resolve_called = True
             return "resolved-file", {"name": "Demo"}
@@ -486,7 +816,7 @@ class TestDrivePermissionMutatorDryRunBehavior:
             "emailAddress": "friend@example.com",
         }
 
-        async def fake_resolve_drive_item(_service, _file_id, extra_fields=None):
+        async def fake_resolve_drive_item(_service, _file_id, extra_fields=None, cache_user=None):
             return "resolved-file", {"name": "Demo", "webViewLink": "https://drive.google.com/file/d/file-123/view"}
 
         monkeypatch.setattr("gdrive.permissions.resolve_drive_item", fake_resolve_drive_item)
@@ -511,7 +841,7 @@ class TestDrivePermissionMutatorDryRunBehavior:
         service = MagicMock()
         resolve_called = False
 
-        async def fake_resolve_drive_item(_service, _file_id, extra_fields=None):
+        async def fake_resolve_drive_item(_service, _file_id, extra_fields=None, cache_user=None):
             nonlocal resolve_called
             resolve_called = True
             return "resolved-file", {"name": "Demo", "webViewLink": "https://example.com"}
@@ -546,10 +876,11 @@ class TestDrivePermissionMutatorDryRunBehavior:
             "emailAddress": "friend@example.com",
         }
 
-        async def fake_resolve_drive_item(_service, _file_id, extra_fields=None):
+        async def fake_resolve_drive_item(_service, _file_id, extra_fields=None, cache_user=None):
             return "resolved-file", {"name": "Demo", "webViewLink": "https://drive.google.com/file/d/file-123/view"}
 
         monkeypatch.setattr("gdrive.permissions.resolve_drive_item", fake_resolve_drive_item)
+        service.new_batch_http_request.side_effect = lambda callback: _FakeBatch(callback)
 
         recipients = [ShareRecipient(email="friend@example.com", role="reader", share_type="user")]
         result = await batch_impl(
@@ -563,6 +894,100 @@ class TestDrivePermissionMutatorDryRunBehavior:
         assert "Batch share results" in result
         assert service.permissions.return_value.create.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_batch_share_drive_file_batches_creates_and_keeps_recipient_order(self, monkeypatch):
+        """Creates go out in batches of DRIVE_BATCH_SIZE and results follow the recipient order."""
+        from googleapiclient.errors import HttpError
+
+        from gdrive.permissions import ShareRecipient
+
+        batch_impl = _get_innermost_permission_tool_function("batch_share_drive_file")
+        service = MagicMock()
+        batches = []
+
+        def new_batch(callback):
+            batches.append(_FakeBatch(callback))
+            return batches[-1]
+
+        def create(**kwargs):
+            email = kwargs["body"]["emailAddress"]
+            request = MagicMock()
+            if email == "bad@example.com":
+                request.execute.side_effect = HttpError(MagicMock(status=400), b"invalid sharing request")
+            else:
+                request.execute.return_value = {"id": email, "type": "user", "role": "reader", "emailAddress": email}
+            return request
+
+        async def fake_resolve_drive_item(_service, _file_id, extra_fields=None, cache_user=None):
+            return "resolved-file", {"name": "Demo"}
+
+        monkeypatch.setattr("gdrive.permissions.resolve_drive_item", fake_resolve_drive_item)
+        monkeypatch.setattr("gdrive.permissions.DRIVE_BATCH_SIZE", 2)
+        service.new_batch_http_request.side_effect = new_batch
+        service.permissions.return_value.create.side_effect = create
+
+        recipients = [
+            ShareRecipient(email="a@example.com"),
+            ShareRecipient(share_type="domain"),
+            ShareRecipient(email="bad@example.com"),
+            ShareRecipient(email="c@example.com"),
+        ]
+        result = await batch_impl(
+            service=service,
+            user_google_email="user@example.com",
+            file_id="file-123",
+            recipients=recipients,
+            dry_run=False,
+        )
+
+        assert [len(batch.requests) for batch in batches] == [2, 1]
+        assert "Summary: 2 succeeded, 2 failed" in result
+        lines = result.splitlines()
+        results = lines[lines.index("Results:") + 1 : lines.index("Results:") + 5]
+        assert "a@example.com" in results[0]
+        assert results[1] == "  - Skipped: missing domain for domain share"
+        assert results[2].startswith("  - bad@example.com: Failed - ")
+        assert "c@example.com" in results[3]
+
+    @pytest.mark.asyncio
+    async def test_batch_share_drive_file_sends_only_validated_recipients(self, monkeypatch):
+        """Invalid recipients are rejected up front and only valid ones reach permissions().create."""
+        from gdrive.permissions import ShareRecipient
+
+        batch_impl = _get_innermost_permission_tool_function("batch_share_drive_file")
+        service = MagicMock()
+        service.new_batch_http_request.side_effect = lambda callback: _FakeBatch(callback)
+        service.permissions.return_value.create.return_value.execute.return_value = {"id": "perm-1", "type": "domain"}
+
+        async def fake_resolve_drive_item(_service, _file_id, extra_fields=None, cache_user=None):
+            return "resolved-file", {"name": "Demo"}
+
+        monkeypatch.setattr("gdrive.permissions.resolve_drive_item", fake_resolve_drive_item)
+
+        recipients = [
+            ShareRecipient(email="late@example.com", expiration_time="not-a-date"),
+            ShareRecipient(domain="example.com", share_type="domain"),
+        ]
+        result = await batch_impl(
+            service=service,
+            user_google_email="user@example.com",
+            file_id="file-123",
+            recipients=recipients,
+            email_message="hello",
+            dry_run=False,
+        )
+
+        create = service.permissions.return_value.create
+        assert create.call_count == 1
+        assert create.call_args.kwargs == {
+            "fileId": "resolved-file",
+            "body": {"type": "domain", "role": "reader", "domain": "example.com"},
+            "supportsAllDrives": True,
+            "fields": "id, type, role, emailAddress, domain, expirationTime",
+        }
+        assert "  - late@example.com: Failed - " in result
+        assert "Summary: 1 succeeded, 1 failed" in result
+
     @pytest.mark.asyncio
     async def test_update_drive_permission_dry_run_skips_resolution_and_mutation(self, monkeypatch):
         """Default dry-run should skip permission update mutation."""
@@ -570,7 +995,7 @@ class TestDrivePermissionMutatorDryRunBehavior:
         service = MagicMock()
         resolve_called = False
 
-        async def fake_resolve_drive_item(_service, _file_id, extra_fields=None):
+        async def fake_resolve_drive_item(_service, _file_id, extra_fields=None, cache_user=None):
             nonlocal resolve_called
             resolve_called = True
             return "resolved-file", {"name": "Demo"}
@@ -602,7 +1027,7 @@ class TestDrivePermissionMutatorDryRunBehavior:
             "emailAddress": "friend@example.com",
         }
 
-        async def fake_resolve_drive_item(_service, _file_id, extra_fields=None):
+        async def fake_resolve_drive_item(_service, _file_id, extra_fields=None, cache_user=None):
             return "resolved-file", {"name": "Demo"}
 
         monkeypatch.setattr("gdrive.permissions.resolve_drive_item", fake_resolve_drive_item)
@@ -619,6 +1044,36 @@ class TestDrivePermissionMutatorDryRunBehavior:
         assert "Successfully updated permission" in result
         assert service.permissions.return_value.update.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_update_drive_permission_expiration_only_leaves_role_out(self, monkeypatch):
+        """Updating only the expiration sends no role and skips reading the current permission."""
+        update_impl = _get_innermost_permission_tool_function("update_drive_permission")
+        service = MagicMock()
+        service.permissions.return_value.update.return_value.execute.return_value = {
+            "id": "perm-1",
+            "type": "user",
+            "role": "reader",
+            "expirationTime": "2099-01-01T00:00:00Z",
+        }
+
+        async def fake_resolve_drive_item(_service, _file_id, extra_fields=None, cache_user=None):
+            return "resolved-file", {"name": "Demo"}
+
+        monkeypatch.setattr("gdrive.permissions.resolve_drive_item", fake_resolve_drive_item)
+
+        await update_impl(
+            service=service,
+            user_google_email="user@example.com",
+            file_id="file-123",
+            permission_id="perm-1",
+            expiration_time="2099-01-01T00:00:00Z",
+            dry_run=False,
+        )
+
+        update_kwargs = service.permissions.return_value.update.call_args.kwargs
+        assert update_kwargs["body"] == {"expirationTime": "2099-01-01T00:00:00Z"}
+        assert service.permissions.return_value.get.call_count == 0
+
     @pytest.mark.asyncio
     async def test_remove_drive_permission_dry_run_skips_resolution_and_delete(self, monkeypatch):
         """Default dry-run should skip permission delete mutation."""
@@ -626,7 +1081,7 @@ class TestDrivePermissionMutatorDryRunBehavior:
         service = MagicMock()
         resolve_called = False
 
-        async def fake_resolve_drive_item(_service, _file_id, extra_fields=None):
+        async def fake_resolve_drive_item(_service, _file_id, extra_fields=None, cache_user=None):
             nonlocal resolve_called
             resolve_called = True
             return "resolved-file", {"name": "Demo"}
@@ -652,7 +1107,7 @@ class TestDrivePermissionMutatorDryRunBehavior:
         service = MagicMock()
         service.permissions.return_value.delete.return_value.execute.return_value = None
 
-        async def fake_resolve_drive_item(_service, _file_id, extra_fields=None):
+        async def fake_resolve_drive_item(_service, _file_id, extra_fields=None, cache_user=None):
             return "resolved-file", {"name": "Demo"}
 
         monkeypatch.setattr("gdrive.permissions.resolve_drive_item", fake_resolve_drive_item)
@@ -675,7 +1130,7 @@ class TestDrivePermissionMutatorDryRunBehavior:
         service = MagicMock()
         resolve_called = False
 
-        async def fake_resolve_drive_item(_service, _file_id, extra_fields=None):
+        async def fake_resolve_drive_item(_service, _file_id, extra_fields=None, cache_user=None):
             nonlocal resolve_called
             resolve_called = True
             return "resolved-file", {"name": "Demo", "owners": [{"emailAddress": "old@example.com"}]}
@@ -706,7 +1161,7 @@ class TestDrivePermissionMutatorDryRunBehavior:
             "emailAddress": "new-owner@example.com",
         }
 
-        async def fake_resolve_drive_item(_service, _file_id, extra_fields=None):
+        async def fake_resolve_drive_item(_service, _file_id, extra_fields=None, cache_user=None):
             return "resolved-file", {"name": "Demo", "owners": [{"emailAddress": "old@example.com"}]}
 
         monkeypatch.setattr("gdrive.permissions.resolve_drive_item", fake_resolve_drive_item)
@@ -723,6 +1178,35 @@ class TestDrivePermissionMutatorDryRunBehavior:
         assert service.permissions.return_value.create.call_count == 1
 
 
+class TestDrivePermissionReadTools:
+    """Tests for the read-only permission tools."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("tool_name", "expected_line"),
+        [
+            ("get_drive_file_permissions", "  View Link: https://drive.google.com/file/d/file-123/view"),
+            ("get_drive_shareable_link", "  View: https://drive.google.com/file/d/file-123/view"),
+        ],
+    )
+    async def test_metadata_comes_from_the_resolution_lookup(self, tool_name, expected_line):
+        tool_impl = _get_innermost_permission_tool_function(tool_name)
+        service = MagicMock()
+        service.files.return_value.get.return_value.execute.return_value = {
+            "id": "file-123",
+            "name": "Demo",
+            "mimeType": "application/pdf",
+            "webViewLink": "https://drive.google.com/file/d/file-123/view",
+            "permissions": [{"id": "anyoneWithLink", "type": "anyone", "role": "reader"}],
+        }
+
+        result = await tool_impl(service=service, user_google_email="user@example.com", file_id="file-123")
+
+        assert service.files.return_value.get.call_count == 1
+        assert "permissions(" in service.files.return_value.get.call_args.kwargs["fields"]
+        assert expected_line in result.splitlines()
+
+
 class TestDriveSyncMutatorDryRunBehavior:
     """Tests for dry-run defaults on Drive sync mutating tools."""
 
@@ -1046,6 +1530,193 @@ class TestDriveSyncMutatorDryRunBehavior:
         update_version_mock.assert_called_once_with(str(target_file), 9)
 
 
+class TestRetargetExtension:
+    """Tests for export filename extension handling."""
+
+    def test_appends_extension(self):
+        from gdrive.files import _retarget_extension
+
+        assert _retarget_extension("Plan", ".pdf") == "Plan.pdf"
+
+    def test_replaces_other_extension(self):
+        from gdrive.files import _retarget_extension
+
+        assert _retarget_extension("Plan.gdoc", ".docx") == "Plan.docx"
+
+    def test_keeps_matching_extension_in_any_case(self):
+        from gdrive.files import _retarget_extension
+
+        assert _retarget_extension("Plan.PDF", ".pdf") == "Plan.PDF"
+
+
+class _FakeMediaDownload:
+    """Stand-in for MediaIoBaseDownload serving fixed content in ranged chunks."""
+
+    content = b""
+    requested_ranges: list[tuple[int, int]] = []
+
+    def __init__(self, fd, _request, chunksize=1024 * 1024):
+        self._fd = fd
+        self._chunksize = chunksize
+        self._progress = 0
+
+    def next_chunk(self):
+        start, end = self._progress, self._progress + self._chunksize
+        self.requested_ranges.append((start, end))
+        self._fd.write(self.content[start:end])
+        self._progress = min(end, len(self.content))
+        status = MagicMock(total_size=len(self.content))
+        return status, self._progress == len(self.content)
+
+
+class TestDriveDownloadTools:
+    """Tests for Drive file download tools."""
+
+    @pytest.fixture
+    def fake_download(self, monkeypatch):
+        async def fake_resolve_drive_item(_service, file_id, extra_fields=None):
+            return file_id, {"name": "report.bin", "mimeType": "application/octet-stream"}
+
+        monkeypatch.setattr("gdrive.files.resolve_drive_item", fake_resolve_drive_item)
+        monkeypatch.setattr("gdrive.files.MediaIoBaseDownload", _FakeMediaDownload)
+        monkeypatch.setattr(_FakeMediaDownload, "content", bytes(range(256)) * 4)
+        monkeypatch.setattr(_FakeMediaDownload, "requested_ranges", [])
+        return _FakeMediaDownload
+
+    @pytest.mark.asyncio
+    async def test_download_url_saves_raw_bytes(self, fake_download, monkeypatch, tmp_path):
+        from core.attachment_storage import AttachmentStorage
+
+        download_impl = _get_innermost_tool_function("get_drive_file_download_url")
+        storage = AttachmentStorage()
+        monkeypatch.setattr("core.attachment_storage.STORAGE_DIR", tmp_path)
+        monkeypatch.setattr("gdrive.files.get_attachment_storage", lambda: storage)
+        monkeypatch.setattr("gdrive.files.is_stateless_mode", lambda: False)
+
+        result = await download_impl(service=MagicMock(), user_google_email="user@example.com", file_id="file-1")
+
+        assert "Download URL:" in result
+        assert "(1024 bytes)" in result
+        (saved_id,) = storage._metadata
+        assert storage.get_attachment_path(saved_id).read_bytes() == fake_download.content
+        assert storage.get_attachment_metadata(saved_id)["size"] == 1024
+
+    @pytest.mark.asyncio
+    async def test_download_url_stateless_previews_first_bytes(self, fake_download, monkeypatch):
+        import base64
+
+        download_impl = _get_innermost_tool_function("get_drive_file_download_url")
+        monkeypatch.setattr("gdrive.files.is_stateless_mode", lambda: True)
+
+        result = await download_impl(service=MagicMock(), user_google_email="user@example.com", file_id="file-1")
+
+        assert "(1024 bytes)" in result
+        assert base64.b64encode(fake_download.content[:100]).decode("utf-8") in result
+        assert fake_download.requested_ranges == [(0, 100)]
+
+    @pytest.mark.asyncio
+    async def test_file_content_decodes_utf8(self, fake_download, monkeypatch):
+        content_impl = _get_innermost_tool_function("get_drive_file_content")
+        monkeypatch.setattr(fake_download, "content", "héllo".encode())
+
+        result = await content_impl(service=MagicMock(), user_google_email="user@example.com", file_id="file-1")
+
+        assert result.endswith("--- CONTENT ---\nhéllo")
+
+    @pytest.mark.asyncio
+    async def test_file_content_reports_binary(self, fake_download):
+        content_impl = _get_innermost_tool_function("get_drive_file_content")
+
+        result = await content_impl(service=MagicMock(), user_google_email="user@example.com", file_id="file-1")
+
+        assert "[Binary or unsupported text encoding for mimeType 'application/octet-stream' - 1024 bytes]" in result
+
+    @pytest.mark.asyncio
+    async def test_file_content_extracts_office_text(self, fake_download, monkeypatch):
+        import io
+        import zipfile
+
+        content_impl = _get_innermost_tool_function("get_drive_file_content")
+        docx_mime = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+        w_ns = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            zf.writestr(
+                "word/document.xml", f'<w:document xmlns:w="{w_ns}"><w:body><w:t>Hi</w:t></w:body></w:document>'
+            )
+
+        async def fake_resolve_drive_item(_service, file_id, extra_fields=None):
+            return file_id, {"name": "notes.docx", "mimeType": docx_mime}
+
+        monkeypatch.setattr("gdrive.files.resolve_drive_item", fake_resolve_drive_item)
+        monkeypatch.setattr(fake_download, "content", buffer.getvalue())
+
+        result = await content_impl(service=MagicMock(), user_google_email="user@example.com", file_id="file-1")
+
+        assert result.endswith("--- CONTENT ---\nHi")
+
+    @pytest.mark.asyncio
+    async def test_file_content_skips_office_extraction_for_tiny_files(self, fake_download, monkeypatch):
+        content_impl = _get_innermost_tool_function("get_drive_file_content")
+        docx_mime = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+        async def fake_resolve_drive_item(_service, file_id, extra_fields=None):
+            return file_id, {"name": "empty.docx", "mimeType": docx_mime}
+
+        monkeypatch.setattr("gdrive.files.resolve_drive_item", fake_resolve_drive_item)
+        monkeypatch.setattr(fake_download, "content", b"PK\x05\x06")
+
+        with patch("gdrive.files.extract_office_xml_text") as extract:
+            result = await content_impl(service=MagicMock(), user_google_email="user@example.com", file_id="file-1")
+
+        extract.assert_not_called()
+        assert result.endswith("--- CONTENT ---\nPK\x05\x06")
+
+    @pytest.mark.parametrize(
+        ("native_mime", "export_format", "expected_mime", "expected_name"),
+        [
+            ("application/vnd.google-apps.document", None, "application/pdf", "Plan.pdf"),
+            (
+                "application/vnd.google-apps.document",
+                "docx",
+                "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                "Plan.docx",
+            ),
+            (
+                "application/vnd.google-apps.spreadsheet",
+                "pdf",
+                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                "Plan.xlsx",
+            ),
+            ("application/vnd.google-apps.spreadsheet", "csv", "text/csv", "Plan.csv"),
+            ("application/vnd.google-apps.presentation", None, "application/pdf", "Plan.pdf"),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_download_url_export_formats(
+        self, fake_download, monkeypatch, native_mime, export_format, expected_mime, expected_name
+    ):
+        download_impl = _get_innermost_tool_function("get_drive_file_download_url")
+        storage = MagicMock()
+        storage.save_attachment_file.return_value = "saved-1"
+        service = MagicMock()
+
+        async def fake_resolve_drive_item(_service, file_id, extra_fields=None):
+            return file_id, {"name": "Plan", "mimeType": native_mime}
+
+        monkeypatch.setattr("gdrive.files.resolve_drive_item", fake_resolve_drive_item)
+        monkeypatch.setattr("gdrive.files.get_attachment_storage", lambda: storage)
+        monkeypatch.setattr("gdrive.files.is_stateless_mode", lambda: False)
+
+        result = await download_impl(
+            service=service, user_google_email="user@example.com", file_id="file-1", export_format=export_format
+        )
+
+        service.files.return_value.export_media.assert_called_once_with(fileId="file-1", mimeType=expected_mime)
+        assert storage.save_attachment_file.call_args.kwargs == {"filename": expected_name, "mime_type": expected_mime}
+        assert f"Google native file exported to {expected_mime} format" in result
+
+
 class TestToolRegistration:
     """Tests for MCP tool registration."""
 